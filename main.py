@@ -15,6 +15,7 @@ import logging
 import os
 import sys
 import yaml
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any
 
@@ -31,6 +32,12 @@ from src.core.executive_controller import ExecutiveController
 from src.core.integrated_neural_system import IntegratedNeuralSystem
 from dotenv import load_dotenv
 
+# イベントループの高速化（オプション、Windows非対応）
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 class FreeLLMDriver:
     """Free LLM Driver メインアプリケーション"""
     
@@ -163,7 +170,7 @@ class FreeLLMDriver:
             # 感情的評価による優先度調整
             if self.emotional_system:
                 emotional_context = await self.emotional_system.evaluate_task_emotion(goal, "goal_execution")
-                logging.info(f"💭 感情的評価: {emotional_context.state.value} "
+                logging.info(f"💭 感情的評価: {emotional_context.state.label} "
                            f"(脅威レベル: {emotional_context.threat_level.name}, "
                            f"信頼度: {emotional_context.confidence:.2f})")
             
@@ -438,7 +445,7 @@ class FreeLLMDriver:
                 return
             
             # 感情システム統計
-            stats = self.emotional_system.get_emotional_statistics()
+            stats = self.emotional_system.get_emotional_statistics().to_dict()
             
             # 現在の感情状態
             current_state = stats.get('current_state', 'unknown')
@@ -481,7 +488,8 @@ class FreeLLMDriver:
             
             # 最近の感情変化（可能であれば）
             if hasattr(self.emotional_system, 'emotional_history') and self.emotional_system.emotional_history:
-                recent_emotions = list(self.emotional_system.emotional_history)[-5:]
+                # 履歴全体をコピーせず末尾5件のみ取得
+                recent_emotions = list(islice(reversed(self.emotional_system.emotional_history), 5))[::-1]
                 print(f"\n📈 最近の感情変化:")
                 for i, emotion in enumerate(recent_emotions):
                     emotion_emoji = {
@@ -491,8 +499,8 @@ class FreeLLMDriver:
                         'anxious': '😰',
                         'confident': '😎',
                         'frustrated': '😤'
-                    }.get(emotion.state.value, '❓')
-                    print(f"  {i+1}. {emotion_emoji} {emotion.state.value} "
+                    }.get(emotion.state.label, '❓')
+                    print(f"  {i+1}. {emotion_emoji} {emotion.state.label} "
                           f"(脅威: {emotion.threat_level.name}, 信頼度: {emotion.confidence:.2f})")
             
         except Exception as e:
@@ -596,6 +604,9 @@ class FreeLLMDriver:
     async def cleanup(self):
         """クリーンアップ処理"""
         try:
+            if self.integrated_neural_system:
+                await self.integrated_neural_system.shutdown()
+            
             if self.neural_kernel:
                 await self.neural_kernel.stop_neural_kernel()
                 logging.info("🧠 Neural Kernel 停止完了")
@@ -647,4 +658,8 @@ async def main():
             await app.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloopがあればそのイベントループで実行（イベントループポリシーは変更しない）
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -4,12 +4,13 @@
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from .executor import ExecutionResult, ExecutionStatus
 from ..llm.provider_manager import LLMProviderManager
+from ..utils.cache_manager import SingleFlight
 
 class ReflectionType(Enum):
     """振り返りタイプ"""
@@ -23,8 +24,8 @@ class Reflection:
     """振り返り結果"""
     reflection_type: ReflectionType
     summary: str
-    insights: List[str]
-    recommendations: List[str]
+    insights: Tuple[str, ...] = ()
+    recommendations: Tuple[str, ...] = ()
     confidence_score: float = 0.0
 
 class SimpleReflector:
@@ -33,6 +34,9 @@ class SimpleReflector:
     def __init__(self, llm_manager: LLMProviderManager):
         self.llm_manager = llm_manager
         
+        # 同一プロンプトの同時実行をまとめる
+        self.single_flight = SingleFlight()
+        
         # 軽量プロンプトテンプレート
         self.reflection_templates = {
             ReflectionType.SUCCESS_ANALYSIS: """
@@ -121,10 +125,7 @@ Quick improvement suggestions for next time?
         )
         
         try:
-            response = await self.llm_manager.get_completion(
-                prompt, 
-                task_type="simple_task"
-            )
+            response = await self._get_completion(prompt)
             
             insights = self._extract_insights(response)
             
@@ -132,7 +133,7 @@ Quick improvement suggestions for next time?
                 reflection_type=ReflectionType.SUCCESS_ANALYSIS,
                 summary="成功要因の分析",
                 insights=insights,
-                recommendations=[],
+                recommendations=(),
                 confidence_score=0.8
             )
             
@@ -152,17 +153,14 @@ Quick improvement suggestions for next time?
         )
         
         try:
-            response = await self.llm_manager.get_completion(
-                prompt,
-                task_type="simple_task"
-            )
+            response = await self._get_completion(prompt)
             
             recommendations = self._extract_recommendations(response)
             
             return Reflection(
                 reflection_type=ReflectionType.FAILURE_ANALYSIS,
                 summary="失敗原因の分析",
-                insights=[result.error],
+                insights=(result.error,),
                 recommendations=recommendations,
                 confidence_score=0.7
             )
@@ -191,10 +189,7 @@ Quick improvement suggestions for next time?
         )
         
         try:
-            response = await self.llm_manager.get_completion(
-                prompt,
-                task_type="simple_task"
-            )
+            response = await self._get_completion(prompt)
             
             insights = self._extract_insights(response)
             
@@ -202,7 +197,7 @@ Quick improvement suggestions for next time?
                 reflection_type=ReflectionType.PERFORMANCE_REVIEW,
                 summary=f"パフォーマンス分析 (成功率: {success_rate:.1f}%)",
                 insights=insights,
-                recommendations=[],
+                recommendations=(),
                 confidence_score=0.9
             )
             
@@ -225,17 +220,14 @@ Quick improvement suggestions for next time?
         )
         
         try:
-            response = await self.llm_manager.get_completion(
-                prompt,
-                task_type="simple_task"
-            )
+            response = await self._get_completion(prompt)
             
             recommendations = self._extract_recommendations(response)
             
             return Reflection(
                 reflection_type=ReflectionType.IMPROVEMENT_SUGGESTION,
                 summary="改善提案",
-                insights=[],
+                insights=(),
                 recommendations=recommendations,
                 confidence_score=0.6
             )
@@ -244,7 +236,14 @@ Quick improvement suggestions for next time?
             logging.error(f"❌ 改善提案エラー: {e}")
             return None
     
-    def _extract_insights(self, response: str) -> List[str]:
+    async def _get_completion(self, prompt: str) -> str:
+        """LLM実行（同一プロンプトの同時リクエストは1回に集約）"""
+        return await self.single_flight.run(
+            prompt,
+            lambda: self.llm_manager.get_completion(prompt, task_type="simple_task")
+        )
+    
+    def _extract_insights(self, response: str) -> Tuple[str, ...]:
         """インサイトの抽出"""
         lines = [line.strip() for line in response.split('\n') if line.strip()]
         
@@ -261,9 +260,9 @@ Quick improvement suggestions for next time?
         if not insights and len(lines) > 0:
             insights = lines[:3]  # 最初の3行
         
-        return insights[:3]  # 最大3つのインサイト
+        return tuple(insights[:3])  # 最大3つのインサイト
     
-    def _extract_recommendations(self, response: str) -> List[str]:
+    def _extract_recommendations(self, response: str) -> Tuple[str, ...]:
         """推奨事項の抽出"""
         return self._extract_insights(response)  # 同じロジックを使用
     
@@ -274,16 +273,16 @@ Quick improvement suggestions for next time?
             return Reflection(
                 reflection_type=ReflectionType.SUCCESS_ANALYSIS,
                 summary="タスク成功",
-                insights=[summary],
-                recommendations=[],
+                insights=(summary,),
+                recommendations=(),
                 confidence_score=1.0
             )
         else:
             return Reflection(
                 reflection_type=ReflectionType.FAILURE_ANALYSIS,
                 summary="タスク失敗",
-                insights=[summary],
-                recommendations=["エラーログを確認", "別のアプローチを試行"],
+                insights=(summary,),
+                recommendations=("エラーログを確認", "別のアプローチを試行"),
                 confidence_score=0.8
             )
     
@@ -293,21 +292,19 @@ Quick improvement suggestions for next time?
         if not reflections:
             return "振り返り結果はありません。"
         
-        formatted = "## 振り返り結果\n\n"
+        parts = ["## 振り返り結果\n\n"]
         
         for i, reflection in enumerate(reflections, 1):
-            formatted += f"### {i}. {reflection.summary}\n"
+            parts.append(f"### {i}. {reflection.summary}\n")
             
             if reflection.insights:
-                formatted += "**インサイト:**\n"
-                for insight in reflection.insights:
-                    formatted += f"- {insight}\n"
+                parts.append("**インサイト:**\n")
+                parts.extend(f"- {insight}\n" for insight in reflection.insights)
             
             if reflection.recommendations:
-                formatted += "**推奨事項:**\n"
-                for rec in reflection.recommendations:
-                    formatted += f"- {rec}\n"
+                parts.append("**推奨事項:**\n")
+                parts.extend(f"- {rec}\n" for rec in reflection.recommendations)
             
-            formatted += "\n"
+            parts.append("\n")
         
-        return formatted
\ No newline at end of file
+        return "".join(parts)
\ No newline at end of file
@@ -4,14 +4,44 @@
 """
 
 import hashlib
+import json
 import logging
 import re
+from bisect import bisect_right
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
 from ..llm.provider_manager import LLMProviderManager
-from ..utils.cache_manager import ResponseCache
+from ..utils.cache_manager import ResponseCache, SingleFlight
+
+def _compile_keywords(keywords: List[str]) -> re.Pattern:
+    """キーワード群を1本の正規表現にコンパイル"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# 英単語トークン抽出（単語単位で照合し "reanalyzed" 等の部分一致を防ぐ）
+_WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# 文分割用（英語・日本語の句読点を1パスで処理）
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?。！？]+\s*')
+
+# 目標分類用キーワード（英単語はトークン集合、日本語・記号は部分一致）
+_WEB_SEARCH_WORDS = frozenset({'search', 'web'})
+_WEB_SEARCH_PATTERN = _compile_keywords([
+    '検索', '調べる', '情報', '最新', 'ニュース', '天気', 
+    'について教えて', 'とは', '価格', '料金', '株価', '為替',
+    'インターネット', 'ウェブ', '公式', 'サイト'
+])
+_CODE_WORDS = frozenset({'code', 'program', 'script', 'function', 'class'})
+_ANALYSIS_WORDS = frozenset({'analyze', 'analysis', 'study', 'research'})
+_CREATIVE_WORDS = frozenset({'create', 'write', 'design', 'generate'})
+_QUESTION_WORDS = frozenset({'what', 'how', 'why', 'when', 'where'})
+
+# 複雑さ推定用キーワード
+_COMPLEX_WORDS = frozenset({'multiple', 'various', 'complex', 'advanced', 'comprehensive', 'detailed'})
+_TECH_WORDS = frozenset({'algorithm', 'optimization', 'database', 'api', 'integration'})
+_TECH_PHRASES = ('machine learning',)
 
 class TaskType(Enum):
     """タスクタイプの定義"""
@@ -47,6 +77,16 @@ class Task:
         if self.context is None:
             self.context = {}
 
+# 優先度スコアの閾値（bisectで優先度レベルを引く）
+_PRIORITY_THRESHOLDS = (3, 4, 5)
+_PRIORITY_LEVELS = (TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH, TaskPriority.CRITICAL)
+
+# タスクタイプ別の基本優先度スコア
+_TYPE_PRIORITY_SCORES = {
+    TaskType.CODE: 3,
+    TaskType.ANALYSIS: 2
+}
+
 class EfficientTaskPlanner:
     """効率的なタスクプランナー"""
     
@@ -54,6 +94,9 @@ class EfficientTaskPlanner:
         self.llm_manager = llm_manager
         self.cache = ResponseCache(max_size=500, ttl_hours=12)
         
+        # 同一目標の同時分割リクエストを1回に集約
+        self.single_flight = SingleFlight()
+        
         # シンプルなプロンプトテンプレート（トークン節約）
         self.decomposition_template = """Goal: {goal}
 
@@ -68,22 +111,18 @@ Focus on concrete, actionable steps."""
     def _classify_goal_type(self, goal: str) -> TaskType:
         """目標の種類を分類"""
         goal_lower = goal.lower()
+        tokens = frozenset(_WORD_PATTERN.findall(goal_lower))
         
         # Web検索キーワードの検出
-        search_keywords = [
-            '検索', 'search', '調べる', '情報', '最新', 'ニュース', '天気', 
-            'について教えて', 'とは', '価格', '料金', '株価', '為替',
-            'インターネット', 'ウェブ', 'web', '公式', 'サイト'
-        ]
-        if any(keyword in goal_lower for keyword in search_keywords):
+        if tokens & _WEB_SEARCH_WORDS or _WEB_SEARCH_PATTERN.search(goal_lower):
             return TaskType.WEB_SEARCH
-        elif any(keyword in goal_lower for keyword in ['code', 'program', 'script', 'function', 'class']):
+        elif tokens & _CODE_WORDS:
             return TaskType.CODE
-        elif any(keyword in goal_lower for keyword in ['analyze', 'analysis', 'study', 'research']):
+        elif tokens & _ANALYSIS_WORDS:
             return TaskType.ANALYSIS
-        elif any(keyword in goal_lower for keyword in ['create', 'write', 'design', 'generate']):
+        elif tokens & _CREATIVE_WORDS:
             return TaskType.CREATIVE
-        elif any(keyword in goal_lower for keyword in ['what', 'how', 'why', 'when', 'where', '?']):
+        elif tokens & _QUESTION_WORDS or '?' in goal_lower:
             return TaskType.QUESTION_ANSWER
         elif len(goal.split()) > 20:
             return TaskType.COMPLEX
@@ -94,20 +133,21 @@ Focus on concrete, actionable steps."""
         """目標の複雑さを推定（1-5のスケール）"""
         factors = 0
         goal_lower = goal.lower()
+        tokens = frozenset(_WORD_PATTERN.findall(goal_lower))
+        word_count = len(goal.split())
         
         # 長さベースの複雑さ
-        if len(goal.split()) > 30:
+        if word_count > 30:
             factors += 2
-        elif len(goal.split()) > 15:
+        elif word_count > 15:
             factors += 1
         
         # キーワードベースの複雑さ
-        complex_keywords = ['multiple', 'various', 'complex', 'advanced', 'comprehensive', 'detailed']
-        factors += sum(1 for keyword in complex_keywords if keyword in goal_lower)
+        factors += len(tokens & _COMPLEX_WORDS)
         
         # 技術的複雑さ
-        tech_keywords = ['algorithm', 'optimization', 'machine learning', 'database', 'api', 'integration']
-        factors += sum(1 for keyword in tech_keywords if keyword in goal_lower)
+        factors += len(tokens & _TECH_WORDS)
+        factors += sum(1 for phrase in _TECH_PHRASES if phrase in goal_lower)
         
         return min(5, max(1, factors))
     
@@ -120,8 +160,14 @@ Focus on concrete, actionable steps."""
         
         # キャッシュチェック
         cache_key = f"decompose_{hashlib.md5(goal.encode()).hexdigest()}"
-        cached_result = self.cache.get_cached_response(cache_key)
         
+        # 解析済みタスクのキャッシュを優先（再解析・再ハッシュを省略）
+        cached_tasks = self.cache.get_cached_response(f"{cache_key}_parsed")
+        if cached_tasks:
+            logging.info("💰 解析済みタスクをキャッシュから取得")
+            return self._deserialize_tasks(cached_tasks, goal)[:max_tasks]
+        
+        cached_result = self.cache.get_cached_response(cache_key)
         if cached_result:
             logging.info("💰 タスク分割結果をキャッシュから取得")
             return self._parse_cached_tasks(cached_result, goal)
@@ -143,19 +189,28 @@ Focus on concrete, actionable steps."""
         
         try:
             # LLM実行（シンプルタスクとして実行してAPI使用量を削減）
-            response = await self.llm_manager.get_completion(
-                prompt, 
-                task_type="simple_task"
+            response = await self.single_flight.run(
+                cache_key,
+                lambda: self.llm_manager.get_completion(prompt, task_type="simple_task")
             )
             
-            # キャッシュ保存
-            self.cache.cache_response(cache_key, response)
+            # キャッシュ保存（分類結果とタスク数も含めて自己記述的に保存）
+            self.cache.cache_response(cache_key, json.dumps({
+                'response': response,
+                'goal_type': goal_type.value,
+                'target_tasks': target_tasks
+            }, ensure_ascii=False))
             
             # タスク解析
             tasks = self._parse_llm_response(response, goal, goal_type)
             
             logging.info(f"✅ 目標を{len(tasks)}個のタスクに分割")
-            return tasks[:target_tasks]  # 最大タスク数制限
+            tasks = tasks[:target_tasks]  # 最大タスク数制限
+            
+            # 解析済みタスクもキャッシュ保存
+            self.cache.cache_response(f"{cache_key}_parsed", self._serialize_tasks(tasks))
+            
+            return tasks
             
         except Exception as e:
             logging.error(f"❌ タスク分割エラー: {e}")
@@ -178,8 +233,8 @@ Focus on concrete, actionable steps."""
             if not matches:
                 logging.warning("⚠️ 標準パターンでタスク抽出失敗、フォールバック実行")
                 # 文を分割してタスクとして扱う
-                sentences = [s.strip() for s in response.split('.') if len(s.strip()) > 10]
-                matches = sentences[:3]  # 最大3つ
+                sentences = (s.strip() for s in _SENTENCE_SPLIT_PATTERN.split(response))
+                matches = list(islice((s for s in sentences if len(s) > 10), 3))  # 最大3つ
         
         for i, match in enumerate(matches):
             description = match.strip()
@@ -205,10 +260,51 @@ Focus on concrete, actionable steps."""
         
         return tasks
     
-    def _parse_cached_tasks(self, cached_response: str, original_goal: str) -> List[Task]:
+    def _parse_cached_tasks(self, cached_payload: str, original_goal: str) -> List[Task]:
         """キャッシュされたタスクの解析"""
-        # キャッシュからの復元時は簡略化
-        return self._parse_llm_response(cached_response, original_goal, TaskType.SIMPLE)
+        try:
+            payload = json.loads(cached_payload)
+            response = payload['response']
+            goal_type = TaskType(payload['goal_type'])
+            target_tasks = payload['target_tasks']
+        except (ValueError, KeyError, TypeError):
+            # 旧形式（生レスポンスのみ）のキャッシュは簡略化して復元
+            return self._parse_llm_response(cached_payload, original_goal, TaskType.SIMPLE)
+        
+        # 保存済みの分類結果を使い、分類処理を再実行しない
+        return self._parse_llm_response(response, original_goal, goal_type)[:target_tasks]
+    
+    def _serialize_tasks(self, tasks: List[Task]) -> str:
+        """タスクリストのキャッシュ用シリアライズ"""
+        return json.dumps([
+            {
+                'id': task.id,
+                'description': task.description,
+                'task_type': task.task_type.value,
+                'priority': task.priority.value,
+                'dependencies': task.dependencies,
+                'estimated_tokens': task.estimated_tokens,
+                'context': task.context
+            }
+            for task in tasks
+        ], ensure_ascii=False)
+    
+    def _deserialize_tasks(self, serialized: str, original_goal: str) -> List[Task]:
+        """キャッシュからのタスクリスト復元"""
+        tasks = []
+        for data in json.loads(serialized):
+            context = data['context']
+            context['original_goal'] = original_goal
+            tasks.append(Task(
+                id=data['id'],
+                description=data['description'],
+                task_type=TaskType(data['task_type']),
+                priority=TaskPriority(data['priority']),
+                dependencies=data['dependencies'],
+                estimated_tokens=data['estimated_tokens'],
+                context=context
+            ))
+        return tasks
     
     def _fallback_decomposition(self, goal: str, goal_type: TaskType) -> List[Task]:
         """フォールバック：ルールベースタスク分割"""
@@ -230,9 +326,9 @@ Focus on concrete, actionable steps."""
             ]
         else:
             # 汎用的な分割
-            sentences = goal.split('.')
+            sentences = _SENTENCE_SPLIT_PATTERN.split(goal)
             if len(sentences) > 1:
-                tasks_desc = [s.strip() for s in sentences if s.strip()][:4]
+                tasks_desc = list(islice(filter(None, (s.strip() for s in sentences)), 4))
             else:
                 tasks_desc = [
                     f"{goal}の準備段階",
@@ -259,16 +355,10 @@ Focus on concrete, actionable steps."""
             constraints = {}
         
         # 簡易優先度算出
-        for task in tasks:
-            priority_score = 0
-            
+        decorated = []
+        for index, task in enumerate(tasks):
             # タスクタイプによる優先度
-            if task.task_type == TaskType.CODE:
-                priority_score += 3
-            elif task.task_type == TaskType.ANALYSIS:
-                priority_score += 2
-            else:
-                priority_score += 1
+            priority_score = _TYPE_PRIORITY_SCORES.get(task.task_type, 1)
             
             # 依存関係による優先度
             if not task.dependencies:
@@ -279,17 +369,15 @@ Focus on concrete, actionable steps."""
                 priority_score += 1  # 軽いタスクは優先
             
             # 優先度設定
-            if priority_score >= 5:
-                task.priority = TaskPriority.CRITICAL
-            elif priority_score >= 4:
-                task.priority = TaskPriority.HIGH
-            elif priority_score >= 3:
-                task.priority = TaskPriority.MEDIUM
-            else:
-                task.priority = TaskPriority.LOW
+            priority = _PRIORITY_LEVELS[bisect_right(_PRIORITY_THRESHOLDS, priority_score)]
+            task.priority = priority
+            
+            # ソートキーを事前計算（-indexで同順位は元の順序を維持）
+            decorated.append((priority.value, -task.estimated_tokens, -index, task))
         
         # 優先度でソート
-        return sorted(tasks, key=lambda t: (t.priority.value, -t.estimated_tokens), reverse=True)
+        decorated.sort(reverse=True)
+        return [task for _, _, _, task in decorated]
     
     def get_planner_stats(self) -> Dict[str, Any]:
         """プランナーの統計情報"""
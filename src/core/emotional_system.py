@@ -4,16 +4,69 @@ Emotional Processing System - 大脳辺縁系を模倣した感情・記憶シ
 """
 
 import asyncio
+import functools
+import heapq
 import logging
-import hashlib
-import json
 import math
+import re
+import sys
+import time
 import numpy as np
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
-from enum import Enum
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from typing import Dict, Any, List, Mapping, Optional, Tuple, FrozenSet, Collection, Sequence
+from dataclasses import dataclass
+from enum import Enum, IntEnum
+from datetime import datetime
+from types import MappingProxyType
 from collections import defaultdict, deque
+from itertools import repeat
+from operator import itemgetter
+
+# 多パターン照合の高速化（オプション）
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# タスクパターン抽出用のストップワード
+_STOP_WORDS = frozenset({
+    'の', 'を', 'に', 'は', 'が', 'で', 'から', 'まで', 'と', 'a', 'an', 'the', 'is', 'are',
+    'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'
+})
+
+# 重要語判定（動詞・名詞を部分一致で検出）
+_IMPORTANT_KEYWORD_PATTERN = re.compile('作成|create|分析|analyze|実行|execute|検索|search')
+
+# 大量に生成・保持するデータクラスは__slots__化（Python 3.10以降）
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@functools.lru_cache(maxsize=4096)
+def _pattern_tokens(task_pattern: str) -> FrozenSet[str]:
+    """タスクパターンの単語集合（類似度計算用）"""
+    return frozenset(task_pattern.split('_'))
+
+def _token_jaccard(tokens1: FrozenSet[str], tokens2: FrozenSet[str]) -> float:
+    """単語集合のJaccard類似度（和集合は作らず件数から算出）"""
+    if not tokens1 or not tokens2:
+        return 0.0
+    
+    intersection = len(tokens1 & tokens2)
+    return intersection / (len(tokens1) + len(tokens2) - intersection)
+
+# 記憶の新鮮さの減衰時定数（7日、秒単位）
+_FRESHNESS_DECAY_SECONDS: float = 7 * 24 * 3600
+
+def _score_recall_candidates(similarity: np.ndarray, reinforcement: np.ndarray, success: np.ndarray,
+                             impact_abs: np.ndarray, timestamps: np.ndarray, now: float) -> np.ndarray:
+    """想起候補の総合スコア（関連度・新鮮さ・感情的影響）を一括計算"""
+    # 関連度 = 類似度 + 強化回数ブースト + 成功体験ブースト
+    relevance_scores = similarity + np.minimum(reinforcement / 10.0, 0.5) + np.where(success, 0.2, -0.1)
+    
+    # 新鮮さ（指数減衰、半減期: 7日）
+    freshness_scores = np.exp((timestamps - now) / _FRESHNESS_DECAY_SECONDS)
+    
+    # 感情的影響の強さ（impact_absは格納時に絶対値化済み）
+    return relevance_scores * 0.5 + freshness_scores * 0.3 + impact_abs * 0.2
 
 class ThreatLevel(Enum):
     """脅威レベル"""
@@ -23,16 +76,92 @@ class ThreatLevel(Enum):
     HIGH = 4
     CRITICAL = 5
 
-class EmotionalState(Enum):
-    """感情状態"""
-    NEUTRAL = "neutral"
-    POSITIVE = "positive"
-    NEGATIVE = "negative"
-    ANXIOUS = "anxious"
-    CONFIDENT = "confident"
-    FRUSTRATED = "frustrated"
+# 脅威レベルの判定閾値（各レベルのスコア上限、境界値は下位レベル）
+_THREAT_THRESHOLDS: Tuple[float, ...] = (1.0, 2.5, 5.0, 8.0)
+_THREAT_LEVELS = tuple(ThreatLevel)
+
+# タスクタイプのID（0は未知のタイプ）とIDで引くリスク倍率
+_TASK_TYPE_IDS: Dict[str, int] = {
+    'code': 1,
+    'system': 2,
+    'admin': 3,
+    'analysis': 4,
+    'creative': 5,
+    'qa': 6,
+    'web_search': 7
+}
+_TYPE_RISK_MULTIPLIERS: Tuple[float, ...] = (1.0, 2.0, 3.0, 4.0, 1.0, 0.5, 0.3, 0.8)
+
+def _threat_counts_to_dict(counts: np.ndarray) -> Dict[str, int]:
+    """脅威レベル別カウント配列を {レベル名: 件数} に変換（0件は省略）"""
+    return {level.name: count for level, count in zip(_THREAT_LEVELS, counts.tolist()) if count}
 
-@dataclass
+# 一括評価用の配列版
+_THREAT_THRESHOLD_ARRAY = np.array(_THREAT_THRESHOLDS, dtype=np.float64)
+_TYPE_RISK_MULTIPLIER_ARRAY = np.array(_TYPE_RISK_MULTIPLIERS, dtype=np.float64)
+
+class EmotionalState(IntEnum):
+    """感情状態（連番の整数値で、比較は整数比較・調整表は状態で直接索引）"""
+    NEUTRAL = 0
+    POSITIVE = 1
+    NEGATIVE = 2
+    ANXIOUS = 3
+    CONFIDENT = 4
+    FRUSTRATED = 5
+    
+    @property
+    def label(self) -> str:
+        """表示・統計用の状態名（例: "neutral"）"""
+        return _EMOTIONAL_STATE_LABELS[self]
+
+_EMOTIONAL_STATE_LABELS: Tuple[str, ...] = tuple(state.name.lower() for state in EmotionalState)
+
+# 優先度調整量（脅威レベル別・感情状態別、未掲載は0）
+_THREAT_PRIORITY_ADJUSTMENTS: Dict[ThreatLevel, float] = {
+    ThreatLevel.CRITICAL: -0.3,  # 優先度を下げる
+    ThreatLevel.HIGH: -0.1,
+    ThreatLevel.SAFE: 0.1        # 優先度を上げる
+}
+# 感情状態別はEmotionalStateの整数値で直接索引
+_STATE_PRIORITY_ADJUSTMENTS: Tuple[float, ...] = (
+    0.0,   # NEUTRAL
+    0.0,   # POSITIVE
+    0.0,   # NEGATIVE
+    -0.2,  # ANXIOUS
+    0.15,  # CONFIDENT
+    -0.1   # FRUSTRATED
+)
+# 感情次元への脅威レベル別の補正（元の分岐式の値をレベルごとに展開）
+# valence: SAFE/LOW/MODERATEは固定値、HIGH以上は -(level - 3) * 0.3 の強い罰則
+_THREAT_VALENCE_SHIFTS: Dict[ThreatLevel, float] = {
+    ThreatLevel.SAFE: 0.3,        # 安全なタスクはポジティブ寄り
+    ThreatLevel.LOW: 0.1,
+    ThreatLevel.MODERATE: -0.1,   # 中程度の脅威は軽微なネガティブ
+    ThreatLevel.HIGH: -0.3,       # -(4 - 3) * 0.3
+    ThreatLevel.CRITICAL: -0.6    # -(5 - 3) * 0.3
+}
+# arousal: (level - 1) * 0.15（MODERATEのみ控えめに0.1）
+_THREAT_AROUSAL_SHIFTS: Dict[ThreatLevel, float] = {
+    ThreatLevel.SAFE: 0.0,                    # (1 - 1) * 0.15
+    ThreatLevel.LOW: 0.15,                    # (2 - 1) * 0.15
+    ThreatLevel.MODERATE: 0.1,                # MODERATEは控えめに増加
+    ThreatLevel.HIGH: 0.45,                   # (4 - 1) * 0.15
+    ThreatLevel.CRITICAL: 0.6                 # (5 - 1) * 0.15
+}
+
+def _fuse_priority_adjustment(base_priority: float, threat_adjustment: float,
+                              confidence: float, state_adjustment: float) -> float:
+    """優先度調整の数値演算（脅威 + 信頼度 + 感情状態の調整を合算し0-1にクリップ）"""
+    adjusted_priority = base_priority + (threat_adjustment + confidence * 0.2 + state_adjustment)
+    return 0.0 if adjusted_priority < 0.0 else (1.0 if adjusted_priority > 1.0 else adjusted_priority)
+
+# 一括調整用（ThreatLevel.value - 1 で索引）
+_THREAT_PRIORITY_ADJUSTMENT_ARRAY = np.array(
+    [_THREAT_PRIORITY_ADJUSTMENTS.get(level, 0.0) for level in ThreatLevel], dtype=np.float64
+)
+_STATE_PRIORITY_ADJUSTMENT_ARRAY = np.array(_STATE_PRIORITY_ADJUSTMENTS, dtype=np.float64)
+
+@dataclass(**_DATACLASS_SLOTS)
 class EmotionalContext:
     """感情的文脈"""
     threat_level: ThreatLevel
@@ -43,7 +172,7 @@ class EmotionalContext:
     state: EmotionalState
     timestamp: datetime
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Experience:
     """経験データ"""
     task_id: str
@@ -57,10 +186,103 @@ class Experience:
     timestamp: datetime
     reinforcement_count: int = 1
     decay_factor: float = 1.0
+    timestamp_seconds: float = 0.0  # 新鮮さ計算用のエポック秒
+    pattern_tokens: FrozenSet[str] = frozenset()  # task_patternの単語集合
+    emotional_impact_abs: float = 0.0  # 感情的影響の強さ（格納時に計算）
+    
+    def __post_init__(self):
+        if not self.timestamp_seconds:
+            self.timestamp_seconds = self.timestamp.timestamp()
+        if not self.pattern_tokens:
+            self.pattern_tokens = _pattern_tokens(self.task_pattern)
+        self.emotional_impact_abs = abs(self.emotional_impact)
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class EmotionalStatistics:
+    """感情システムの統計情報"""
+    current_state: str
+    learned_threats: int
+    memory_manager: Mapping[str, Any]  # 読み取り専用ビュー
+    reward_history_size: int
+    expected_rewards: int
+    emotional_history_size: int
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """従来の入れ子辞書形式に変換（表示・シリアライズ用）"""
+        return {
+            'current_state': self.current_state,
+            'threat_detector': {
+                'learned_threats': self.learned_threats
+            },
+            'memory_manager': dict(self.memory_manager),
+            'reward_system': {
+                'reward_history_size': self.reward_history_size,
+                'expected_rewards': self.expected_rewards
+            },
+            'emotional_history_size': self.emotional_history_size
+        }
+
+class PatternScanner:
+    """カテゴリ付きパターンの一括照合（pyahocorasickがあれば1パスで走査）"""
+    
+    __slots__ = ('categorized_patterns', 'distinct_patterns', 'automaton')
+    
+    def __init__(self, categorized_patterns: Dict[str, List[str]]):
+        self.categorized_patterns = {
+            category: list(patterns) for category, patterns in categorized_patterns.items()
+        }
+        self.distinct_patterns = tuple(dict.fromkeys(
+            pattern for patterns in self.categorized_patterns.values() for pattern in patterns
+        ))
+        self.automaton = None
+        
+        if ahocorasick is not None:
+            # パターン -> (カテゴリ, カテゴリ内の位置) を1つのオートマトンに登録
+            index = defaultdict(list)
+            for category, patterns in self.categorized_patterns.items():
+                for position, pattern in enumerate(patterns):
+                    index[pattern].append((category, position))
+            
+            if index:
+                self.automaton = ahocorasick.Automaton()
+                for pattern, targets in index.items():
+                    self.automaton.add_word(pattern, (pattern, tuple(targets)))
+                self.automaton.make_automaton()
+    
+    def scan(self, text: str) -> Dict[str, List[str]]:
+        """カテゴリ別の一致パターンを元の順序で返す"""
+        if self.automaton is None:
+            hits = {}
+            for category, patterns in self.categorized_patterns.items():
+                matches = [pattern for pattern in patterns if pattern in text]
+                if matches:
+                    hits[category] = matches
+            return hits
+        
+        hits = defaultdict(list)
+        seen = set()
+        for _, (pattern, targets) in self.automaton.iter(text):
+            if pattern in seen:
+                continue
+            seen.add(pattern)
+            for category, position in targets:
+                hits[category].append((position, pattern))
+        
+        return {category: [pattern for _, pattern in sorted(found)] for category, found in hits.items()}
+    
+    def matched(self, text: str) -> Collection[str]:
+        """一致したパターンを重複なしで返す（カテゴリ分けと並べ替えを省略）"""
+        if self.automaton is None:
+            return [pattern for pattern in self.distinct_patterns if pattern in text]
+        return {pattern for _, (pattern, _) in self.automaton.iter(text)}
 
 class ThreatDetector:
     """扁桃体機能 - 脅威検知システム"""
     
+    __slots__ = ('threat_patterns', 'positive_patterns', 'threat_weights', 'learned_threats',
+                 'max_learned_threats', 'learned_threat_count', 'stats_version',
+                 '_pattern_scanner', '_folded_weights')
+    
     def __init__(self):
         self.threat_patterns = {
             # セキュリティ関連のパターン
@@ -105,45 +327,34 @@ class ThreatDetector:
         
         # 学習された脅威パターン
         self.learned_threats = defaultdict(float)
+        self.max_learned_threats = 5000
+        self.learned_threat_count = 0  # len(learned_threats)のキャッシュ
+        self.stats_version = 0  # 学習パターン数が変わるたびに加算
+        
+        # 既知パターンとポジティブパターンを一括照合するスキャナー
+        self._pattern_scanner = PatternScanner({
+            **self.threat_patterns,
+            'positive': self.positive_patterns
+        })
+        
+        # スコアのみの評価用に、パターンごとの脅威重み合計とポジティブ件数を畳み込んだ表
+        self._folded_weights: Dict[str, Tuple[float, int]] = {}
+        for pattern in self._pattern_scanner.distinct_patterns:
+            threat_weight = sum(
+                patterns.count(pattern) * self.threat_weights[category]
+                for category, patterns in self.threat_patterns.items()
+            )
+            self._folded_weights[pattern] = (threat_weight, self.positive_patterns.count(pattern))
         
-    async def assess_threat(self, task_description: str, task_type: str = "general") -> Tuple[ThreatLevel, float, Dict[str, Any]]:
-        """脅威レベルの評価"""
+    def assess_threat(self, task_description: str, task_type: str = "general",
+                      detail: bool = False) -> Tuple[ThreatLevel, float, Dict[str, Any]]:
+        """脅威レベルの評価（detail=Trueの場合のみ評価詳細を構築）"""
         try:
             description_lower = task_description.lower()
-            threat_score = 0.0
-            detected_patterns = {}
-            
-            # 既知のパターンマッチング
-            for category, patterns in self.threat_patterns.items():
-                matches = [pattern for pattern in patterns if pattern in description_lower]
-                if matches:
-                    category_score = len(matches) * self.threat_weights[category]
-                    threat_score += category_score
-                    detected_patterns[category] = {
-                        'matches': matches,
-                        'score': category_score
-                    }
-            
-            # 学習された脅威パターンチェック
-            for pattern, weight in self.learned_threats.items():
-                if pattern in description_lower:
-                    threat_score += weight
-                    detected_patterns['learned'] = detected_patterns.get('learned', [])
-                    detected_patterns['learned'].append({'pattern': pattern, 'weight': weight})
-            
-            # ポジティブパターンによる脅威軽減
-            positive_matches = [pattern for pattern in self.positive_patterns if pattern in description_lower]
-            if positive_matches:
-                # 分析系タスクは軽減量を調整
-                if 'analyze' in description_lower or '分析' in description_lower:
-                    positive_reduction = len(positive_matches) * 1.0  # 分析は軽減控えめ
-                else:
-                    positive_reduction = len(positive_matches) * 2.0  # その他は大幅軽減
-                threat_score = max(0, threat_score - positive_reduction)
-                detected_patterns['positive'] = {
-                    'matches': positive_matches,
-                    'reduction': positive_reduction
-                }
+            if detail:
+                threat_score, detected_patterns = self._score_patterns(description_lower)
+            else:
+                threat_score = self._score_raw(description_lower)
             
             # タスクタイプによる調整
             type_multiplier = self._get_type_risk_multiplier(task_type)
@@ -156,6 +367,12 @@ class ThreatDetector:
             # 脅威レベルの判定
             threat_level = self._calculate_threat_level(threat_score)
             
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("🔍 脅威評価: %s... -> %s (スコア: %.2f)", task_description[:50], threat_level.name, threat_score)
+            
+            if not detail:
+                return threat_level, threat_score, {}
+            
             assessment_details = {
                 'raw_score': threat_score,
                 'type_multiplier': type_multiplier,
@@ -164,51 +381,173 @@ class ThreatDetector:
                 'assessment_timestamp': datetime.now()
             }
             
-            logging.debug(f"🔍 脅威評価: {task_description[:50]}... -> {threat_level.name} (スコア: {threat_score:.2f})")
-            
             return threat_level, threat_score, assessment_details
             
         except Exception as e:
-            logging.error(f"❌ 脅威評価エラー: {e}")
+            logging.error("❌ 脅威評価エラー: %s", e)
             return ThreatLevel.MODERATE, 3.0, {'error': str(e)}
     
+    def assess_threats_batch(self, task_descriptions: List[str],
+                             task_types: Optional[List[str]] = None,
+                             detail: bool = False) -> Tuple[List[ThreatLevel], np.ndarray, List[Dict[str, Any]]]:
+        """複数タスクの脅威レベルを一括評価（パターン照合以外をベクトル化、detail=Falseなら詳細は空リスト）"""
+        if task_types is None:
+            task_types = ["general"] * len(task_descriptions)
+        
+        count = len(task_descriptions)
+        try:
+            # パターン照合はタスクごとに1回
+            raw_scores = np.empty(count, dtype=np.float64)
+            detected = []
+            for i, task_description in enumerate(task_descriptions):
+                if detail:
+                    raw_scores[i], detected_patterns = self._score_patterns(task_description.lower())
+                    detected.append(detected_patterns)
+                else:
+                    raw_scores[i] = self._score_raw(task_description.lower())
+            
+            # タスクタイプ倍率・長さ係数・レベル判定を一括計算
+            type_ids = np.fromiter(
+                (_TASK_TYPE_IDS.get(task_type.lower(), 0) for task_type in task_types), dtype=np.intp, count=count
+            )
+            type_multipliers = _TYPE_RISK_MULTIPLIER_ARRAY[type_ids]
+            length_factors = np.minimum(
+                np.fromiter(map(len, task_descriptions), dtype=np.float64, count=count) / 100, 2.0
+            )
+            threat_scores = raw_scores * type_multipliers + length_factors
+            level_indices = np.searchsorted(_THREAT_THRESHOLD_ARRAY, threat_scores, side='left')
+            
+            threat_levels = [_THREAT_LEVELS[i] for i in level_indices.tolist()]
+            if not detail:
+                return threat_levels, threat_scores, []
+            
+            assessment_timestamp = datetime.now()
+            assessment_details = [
+                {
+                    'raw_score': score,
+                    'type_multiplier': multiplier,
+                    'length_factor': length_factor,
+                    'detected_patterns': detected_patterns,
+                    'assessment_timestamp': assessment_timestamp
+                }
+                for score, multiplier, length_factor, detected_patterns in zip(
+                    threat_scores.tolist(), type_multipliers.tolist(), length_factors.tolist(), detected
+                )
+            ]
+            
+            logging.debug("🔍 脅威一括評価: %d件", count)
+            
+            return threat_levels, threat_scores, assessment_details
+            
+        except Exception as e:
+            logging.error("❌ 脅威一括評価エラー: %s", e)
+            return [ThreatLevel.MODERATE] * count, np.full(count, 3.0), [{'error': str(e)} for _ in range(count)]
+    
+    def _score_raw(self, description_lower: str) -> float:
+        """畳み込み済みの重み表による脅威スコア（_score_patternsと同値、検出詳細なし）"""
+        threat_score = 0.0
+        positive_count = 0
+        for pattern in self._pattern_scanner.matched(description_lower):
+            threat_weight, positive = self._folded_weights[pattern]
+            threat_score += threat_weight
+            positive_count += positive
+        
+        # 学習された脅威パターン
+        learned_threats = self.learned_threats
+        for pattern in dict.fromkeys(description_lower.split()):
+            weight = learned_threats.get(pattern)
+            if weight is not None:
+                threat_score += weight
+        
+        # ポジティブパターンによる脅威軽減（分析系タスクは控えめ）
+        if positive_count:
+            if 'analyze' in description_lower or '分析' in description_lower:
+                threat_score = max(0, threat_score - positive_count * 1.0)
+            else:
+                threat_score = max(0, threat_score - positive_count * 2.0)
+        
+        return threat_score
+    
+    def _score_patterns(self, description_lower: str) -> Tuple[float, Dict[str, Any]]:
+        """パターン照合による脅威スコア（タイプ倍率・長さ係数の適用前）"""
+        threat_score = 0.0
+        detected_patterns = {}
+        
+        # 既知パターンとポジティブパターンを一括照合
+        category_matches = self._pattern_scanner.scan(description_lower)
+        
+        # 既知のパターンマッチング
+        for category in self.threat_patterns:
+            matches = category_matches.get(category)
+            if matches:
+                category_score = len(matches) * self.threat_weights[category]
+                threat_score += category_score
+                detected_patterns[category] = {
+                    'matches': matches,
+                    'score': category_score
+                }
+        
+        # 学習された脅威パターンチェック（学習時と同じ単語分割で完全一致）
+        learned_threats = self.learned_threats
+        learned_hits = [
+            {'pattern': pattern, 'weight': learned_threats[pattern]}
+            for pattern in dict.fromkeys(description_lower.split()) if pattern in learned_threats
+        ]
+        if learned_hits:
+            for hit in learned_hits:
+                threat_score += hit['weight']
+            detected_patterns['learned'] = learned_hits
+        
+        # ポジティブパターンによる脅威軽減
+        positive_matches = category_matches.get('positive')
+        if positive_matches:
+            # 分析系タスクは軽減量を調整
+            if 'analyze' in description_lower or '分析' in description_lower:
+                positive_reduction = len(positive_matches) * 1.0  # 分析は軽減控えめ
+            else:
+                positive_reduction = len(positive_matches) * 2.0  # その他は大幅軽減
+            threat_score = max(0, threat_score - positive_reduction)
+            detected_patterns['positive'] = {
+                'matches': positive_matches,
+                'reduction': positive_reduction
+            }
+        
+        return threat_score, detected_patterns
+    
     def _get_type_risk_multiplier(self, task_type: str) -> float:
         """タスクタイプによるリスク倍率"""
-        multipliers = {
-            'code': 2.0,
-            'system': 3.0,
-            'admin': 4.0,
-            'analysis': 1.0,
-            'creative': 0.5,
-            'qa': 0.3,
-            'web_search': 0.8
-        }
-        return multipliers.get(task_type.lower(), 1.0)
+        return _TYPE_RISK_MULTIPLIERS[_TASK_TYPE_IDS.get(task_type.lower(), 0)]
     
     def _calculate_threat_level(self, score: float) -> ThreatLevel:
         """スコアから脅威レベルを判定"""
-        if score <= 1.0:
-            return ThreatLevel.SAFE
-        elif score <= 2.5:
-            return ThreatLevel.LOW
-        elif score <= 5.0:
-            return ThreatLevel.MODERATE
-        elif score <= 8.0:
-            return ThreatLevel.HIGH
-        else:
-            return ThreatLevel.CRITICAL
+        return _THREAT_LEVELS[bisect_left(_THREAT_THRESHOLDS, score)]
     
-    async def learn_from_outcome(self, task_description: str, was_successful: bool, impact_severity: float):
+    def learn_from_outcome(self, task_description: str, was_successful: bool, impact_severity: float) -> None:
         """結果から学習して脅威パターンを更新"""
         try:
             description_lower = task_description.lower()
             
             # 失敗した場合、関連パターンの脅威重みを増加
             if not was_successful and impact_severity > 0.5:
+                learned_threats = self.learned_threats
                 words = description_lower.split()
                 for word in words:
                     if len(word) > 3:  # 短すぎる単語は除外
-                        self.learned_threats[word] += impact_severity * 0.5
+                        weight = learned_threats.get(word)
+                        if weight is None:
+                            weight = 0.0
+                            self.learned_threat_count += 1
+                            self.stats_version += 1
+                        # 重みの上限設定
+                        learned_threats[word] = min(weight + impact_severity * 0.5, 5.0)
+                
+                # 上限超過時は重みの低いパターンをまとめて削除（1割）
+                if self.learned_threat_count > self.max_learned_threats:
+                    excess = self.learned_threat_count - self.max_learned_threats + self.max_learned_threats // 10
+                    for pattern, _ in heapq.nsmallest(excess, learned_threats.items(), key=itemgetter(1)):
+                        del learned_threats[pattern]
+                    self.learned_threat_count -= excess
+                    self.stats_version += 1
             
             # 成功した場合、脅威重みを軽微に減少
             elif was_successful:
@@ -217,22 +556,36 @@ class ThreatDetector:
                     if word in self.learned_threats:
                         self.learned_threats[word] *= 0.95  # 5%減少
             
-            # 重みの上限設定
-            for pattern in self.learned_threats:
-                self.learned_threats[pattern] = min(self.learned_threats[pattern], 5.0)
-            
         except Exception as e:
-            logging.error(f"❌ 脅威学習エラー: {e}")
+            logging.error("❌ 脅威学習エラー: %s", e)
+
+def _new_pattern_knowledge() -> Dict[str, Any]:
+    """意味記憶の新規パターン項目"""
+    return {
+        'success_rate': 0.0,
+        'total_attempts': 0,
+        'successful_attempts': 0,
+        'average_execution_time': 0.0,
+        'emotional_variance': 0.0,
+        'common_threats': np.zeros(len(_THREAT_LEVELS), dtype=np.int32),  # ThreatLevel.value - 1 で索引
+        'confidence': 0.0
+    }
 
 class AdaptiveMemory:
     """海馬機能 - 適応的記憶管理システム"""
     
+    __slots__ = ('episodic_memory', 'semantic_memory', 'working_memory', 'memory_stats',
+                 'max_episodic_memories', 'stats_version', '_statistics_version', '_statistics',
+                 '_slots', '_free_slots', '_slot_count', '_next_sequence', '_type_ids', '_type_slots', '_slot_experiences',
+                 '_exp_timestamps', '_exp_impact_abs', '_exp_success', '_exp_reinforcement',
+                 '_exp_type_id', '_exp_live')
+    
     def __init__(self, max_episodic_memories: int = 1000, max_working_memory: int = 50):
         # エピソード記憶（具体的な経験）
         self.episodic_memory: Dict[str, Experience] = {}
         
         # 意味記憶（一般的な知識・パターン）
-        self.semantic_memory: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        self.semantic_memory: Dict[str, Dict[str, Any]] = defaultdict(_new_pattern_knowledge)
         
         # 作業記憶（短期記憶）
         self.working_memory = deque(maxlen=max_working_memory)
@@ -246,16 +599,102 @@ class AdaptiveMemory:
         }
         
         self.max_episodic_memories = max_episodic_memories
+        self.stats_version = 0  # 記憶の更新ごとに加算
+        self._statistics_version = -1
+        self._statistics: Mapping[str, Any] = MappingProxyType({})
         
-    async def store_experience(self, task_id: str, task_description: str, task_type: str, 
-                              result_quality: float, success: bool, execution_time: float,
-                              emotional_context: EmotionalContext) -> None:
-        """経験を感情的重みと共に保存"""
+        # エピソード記憶のSoA索引（想起時のスコアリングをベクトル化）
+        self._slots: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._slot_count = 0
+        self._next_sequence = 0  # 登録順の通し番号（episodic_memoryの挿入順と一致させる）
+        self._type_ids: Dict[str, int] = {}
+        # タイプ別バケット（スロット -> 登録順、各バケットは常に登録順に並べて保持）
+        self._type_slots: Dict[int, Dict[int, int]] = defaultdict(dict)
+        self._slot_experiences: List[Optional[Experience]] = []
+        self._exp_timestamps = np.zeros(0, dtype=np.float64)
+        self._exp_impact_abs = np.zeros(0, dtype=np.float64)
+        self._exp_success = np.zeros(0, dtype=np.bool_)
+        self._exp_reinforcement = np.zeros(0, dtype=np.int32)
+        self._exp_type_id = np.zeros(0, dtype=np.int32)
+        self._exp_live = np.zeros(0, dtype=np.bool_)
+        self._grow_slots(64)
+    
+    def _grow_slots(self, capacity: int) -> None:
+        """SoA配列の容量拡張"""
+        def grow(array: np.ndarray, fill) -> np.ndarray:
+            grown = np.full(capacity, fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+        
+        self._exp_timestamps = grow(self._exp_timestamps, 0.0)
+        self._exp_impact_abs = grow(self._exp_impact_abs, 0.0)
+        self._exp_success = grow(self._exp_success, False)
+        self._exp_reinforcement = grow(self._exp_reinforcement, 0)
+        self._exp_type_id = grow(self._exp_type_id, -1)
+        self._exp_live = grow(self._exp_live, False)
+        self._slot_experiences.extend([None] * (capacity - len(self._slot_experiences)))
+    
+    def _index_experience(self, experience: Experience) -> None:
+        """経験をSoA索引に登録（同一task_idはスロットを再利用）"""
+        slot = self._slots.get(experience.task_id)
+        if slot is not None:
+            # 同一task_idの上書きはepisodic_memory上の位置が変わらないため登録順も維持
+            sequence = self._type_slots[int(self._exp_type_id[slot])][slot]
+        else:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = self._slot_count
+                self._slot_count += 1
+                if slot >= len(self._exp_live):
+                    self._grow_slots(len(self._exp_live) * 2)
+            self._slots[experience.task_id] = slot
+        
+        type_id = self._type_ids.setdefault(experience.task_type, len(self._type_ids))
+        previous_type_id = int(self._exp_type_id[slot])
+        if self._exp_live[slot] and previous_type_id != type_id:
+            del self._type_slots[previous_type_id][slot]
+        bucket = self._type_slots[type_id]
+        if slot not in bucket and bucket and sequence < next(reversed(bucket.values())):
+            # 既存経験のタイプ変更（古い登録順での移動）のときだけ並べ直す
+            bucket[slot] = sequence
+            self._type_slots[type_id] = dict(sorted(bucket.items(), key=itemgetter(1)))
+        else:
+            bucket[slot] = sequence
+        
+        self._slot_experiences[slot] = experience
+        self._exp_timestamps[slot] = experience.timestamp_seconds
+        self._exp_impact_abs[slot] = experience.emotional_impact_abs
+        self._exp_success[slot] = experience.success
+        self._exp_reinforcement[slot] = experience.reinforcement_count
+        self._exp_type_id[slot] = type_id
+        self._exp_live[slot] = True
+    
+    def _unindex_experience(self, task_id: str) -> None:
+        """経験をSoA索引から削除"""
+        slot = self._slots.pop(task_id, None)
+        if slot is not None:
+            del self._type_slots[int(self._exp_type_id[slot])][slot]
+            self._slot_experiences[slot] = None
+            self._exp_live[slot] = False
+            self._free_slots.append(slot)
+        
+    def store_experience(self, task_id: str, task_description: str, task_type: str, 
+                        result_quality: float, success: bool, execution_time: float,
+                        emotional_context: EmotionalContext,
+                        task_pattern: Optional[str] = None) -> Optional[str]:
+        """経験を感情的重みと共に保存（使用したタスクパターンを返す）"""
+        self.stats_version += 1  # 途中で失敗しても統計キャッシュは無効化する
         try:
-            # タスクパターンの抽出
-            task_pattern = self._extract_task_pattern(task_description, task_type)
+            # タスクパターンの抽出（呼び出し元で抽出済みなら再利用）
+            if task_pattern is None:
+                task_pattern = self._extract_task_pattern(task_description, task_type)
             
             # 経験オブジェクトの作成
+            now = time.time()
             experience = Experience(
                 task_id=task_id,
                 task_pattern=task_pattern,
@@ -265,88 +704,101 @@ class AdaptiveMemory:
                 execution_time=execution_time,
                 emotional_impact=emotional_context.emotional_weight,
                 threat_assessment=emotional_context.threat_level,
-                timestamp=datetime.now()
+                timestamp=datetime.fromtimestamp(now),
+                timestamp_seconds=now
             )
             
             # 類似経験の検索と強化
-            similar_experiences = await self._find_similar_experiences(task_pattern, task_type)
+            similar_slots, _ = self._match_similar_slots(task_pattern, task_type)
             
-            if similar_experiences:
+            if similar_slots:
                 # 既存の経験を強化
-                for similar_exp in similar_experiences[:3]:  # 上位3つを強化
-                    similar_exp.reinforcement_count += 1
+                slot_experiences = self._slot_experiences
+                exp_reinforcement = self._exp_reinforcement
+                for slot in similar_slots[:3]:  # 上位3つを強化
+                    similar_exp = slot_experiences[slot]
+                    reinforcement_count = similar_exp.reinforcement_count + 1
+                    similar_exp.reinforcement_count = reinforcement_count
+                    exp_reinforcement[slot] = reinforcement_count
                     # 新しい結果で重み付き平均を計算
-                    weight = 1.0 / similar_exp.reinforcement_count
+                    weight = 1.0 / reinforcement_count
                     similar_exp.result_quality = (
                         similar_exp.result_quality * (1 - weight) + result_quality * weight
                     )
             
             # エピソード記憶に保存
             self.episodic_memory[task_id] = experience
+            self._index_experience(experience)
             
             # 作業記憶に追加
             self.working_memory.append(experience)
             
             # 意味記憶の更新
-            await self._update_semantic_memory(task_pattern, task_type, experience)
+            self._update_semantic_memory(task_pattern, task_type, experience)
             
             # メモリサイズ制限の管理
-            await self._manage_memory_capacity()
+            self._manage_memory_capacity()
             
             # 統計更新
             self.memory_stats['total_experiences'] += 1
             if success:
                 self.memory_stats['successful_experiences'] += 1
             
-            logging.debug(f"🧠 経験保存: {task_pattern} -> 成功: {success}, 品質: {result_quality:.2f}")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("🧠 経験保存: %s -> 成功: %s, 品質: %.2f", task_pattern, success, result_quality)
+            
+            return task_pattern
             
         except Exception as e:
-            logging.error(f"❌ 経験保存エラー: {e}")
+            logging.error("❌ 経験保存エラー: %s", e)
+            return task_pattern
     
-    async def recall_similar_experiences(self, task_description: str, task_type: str, 
-                                       limit: int = 10) -> List[Experience]:
+    def recall_similar_experiences(self, task_description: str, task_type: str, 
+                                 limit: int = 10) -> List[Experience]:
         """類似経験の想起"""
         try:
             task_pattern = self._extract_task_pattern(task_description, task_type)
-            similar_experiences = await self._find_similar_experiences(task_pattern, task_type)
-            
-            # 関連度と新鮮さによるスコアリング
-            scored_experiences = []
-            for exp in similar_experiences:
-                relevance_score = self._calculate_relevance_score(task_pattern, exp)
-                freshness_score = self._calculate_freshness_score(exp)
-                emotional_score = abs(exp.emotional_impact)  # 感情的影響の強さ
-                
-                combined_score = (
-                    relevance_score * 0.5 + 
-                    freshness_score * 0.3 + 
-                    emotional_score * 0.2
-                )
-                
-                scored_experiences.append((combined_score, exp))
+            slots, similarity = self._match_similar_slots(task_pattern, task_type, with_similarity=True)
+            if not slots:
+                return []
+            
+            # 検索時の類似度を再利用し、SoA配列上で一括スコアリング
+            slots = np.array(slots, dtype=np.intp)
+            combined_scores = _score_recall_candidates(
+                np.array(similarity, dtype=np.float64),
+                self._exp_reinforcement[slots],
+                self._exp_success[slots],
+                self._exp_impact_abs[slots],
+                self._exp_timestamps[slots],
+                time.time()
+            )
             
-            # スコア順でソート
-            scored_experiences.sort(key=lambda x: x[0], reverse=True)
+            # スコア順でソート（同点は検索順を維持）
+            ranking = np.argsort(-combined_scores, kind='stable')[:limit]
             
-            return [exp for _, exp in scored_experiences[:limit]]
+            return [self._slot_experiences[slots[i]] for i in ranking]
             
         except Exception as e:
-            logging.error(f"❌ 経験想起エラー: {e}")
+            logging.error("❌ 経験想起エラー: %s", e)
             return []
     
-    async def get_pattern_knowledge(self, task_pattern: str, task_type: str) -> Dict[str, Any]:
+    def get_pattern_knowledge(self, task_pattern: str, task_type: str) -> Dict[str, Any]:
         """パターンに関する意味記憶の取得"""
         try:
             pattern_key = f"{task_type}:{task_pattern}"
-            return self.semantic_memory.get(pattern_key, {
-                'success_rate': 0.5,
-                'average_execution_time': 30.0,
-                'common_issues': [],
-                'confidence': 0.0
-            })
+            pattern_data = self.semantic_memory.get(pattern_key)
+            if pattern_data is None:
+                return {
+                    'success_rate': 0.5,
+                    'average_execution_time': 30.0,
+                    'common_issues': [],
+                    'confidence': 0.0
+                }
+            
+            return {**pattern_data, 'common_threats': _threat_counts_to_dict(pattern_data['common_threats'])}
             
         except Exception as e:
-            logging.error(f"❌ パターン知識取得エラー: {e}")
+            logging.error("❌ パターン知識取得エラー: %s", e)
             return {}
     
     def _extract_task_pattern(self, task_description: str, task_type: str) -> str:
@@ -355,14 +807,10 @@ class AdaptiveMemory:
         words = task_description.lower().split()
         
         # ストップワードの除去
-        stop_words = {'の', 'を', 'に', 'は', 'が', 'で', 'から', 'まで', 'と', 'a', 'an', 'the', 'is', 'are', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        meaningful_words = [word for word in words if word not in stop_words and len(word) > 2]
+        meaningful_words = [word for word in words if len(word) > 2 and word not in _STOP_WORDS]
         
-        # 重要度による重み付け（動詞、名詞を優先）
-        important_words = []
-        for word in meaningful_words[:5]:  # 上位5語
-            if any(keyword in word for keyword in ['作成', 'create', '分析', 'analyze', '実行', 'execute', '検索', 'search']):
-                important_words.append(word)
+        # 重要度による重み付け（動詞、名詞を優先、上位5語）
+        important_words = [word for word in meaningful_words[:5] if _IMPORTANT_KEYWORD_PATTERN.search(word)]
         
         # パターン文字列の生成
         if important_words:
@@ -372,35 +820,48 @@ class AdaptiveMemory:
         
         return pattern or 'generic_task'
     
-    async def _find_similar_experiences(self, task_pattern: str, task_type: str) -> List[Experience]:
+    def _find_similar_experiences(self, task_pattern: str, task_type: str) -> List[Experience]:
         """類似経験の検索"""
-        similar_experiences = []
+        slots, _ = self._match_similar_slots(task_pattern, task_type)
+        return [self._slot_experiences[slot] for slot in slots]
+    
+    def _match_similar_slots(self, task_pattern: str, task_type: str,
+                             with_similarity: bool = False) -> Tuple[List[int], List[float]]:
+        """類似経験のスロット検索（必要に応じて各候補の類似度も返す）"""
+        matched_slots = []
+        similarities = []
+        slot_experiences = self._slot_experiences
         
-        for experience in self.episodic_memory.values():
-            # タスクタイプが同じ
-            if experience.task_type == task_type:
-                similarity = self._calculate_pattern_similarity(task_pattern, experience.task_pattern)
+        type_id = self._type_ids.get(task_type, -1)
+        target_tokens = _pattern_tokens(task_pattern)
+        pattern_words = task_pattern.split('_')
+        
+        # 登録順に並んだ各バケットを併合して全経験を登録順に走査
+        # （上位の強化対象・想起の同点順をepisodic_memoryの挿入順に揃える）
+        candidates = heapq.merge(*[
+            zip(bucket.values(), bucket.keys(), repeat(bucket_type_id == type_id))
+            for bucket_type_id, bucket in self._type_slots.items()
+        ])
+        for _, slot, same_type in candidates:
+            experience = slot_experiences[slot]
+            if same_type:
+                # タスクタイプが同じ
+                similarity = _token_jaccard(target_tokens, experience.pattern_tokens)
                 if similarity > 0.3:  # 30%以上の類似度
-                    similar_experiences.append(experience)
+                    matched_slots.append(slot)
+                    similarities.append(similarity)
             
             # パターンが部分的に一致
-            elif any(word in experience.task_pattern for word in task_pattern.split('_')):
-                similar_experiences.append(experience)
+            elif any(word in experience.task_pattern for word in pattern_words):
+                matched_slots.append(slot)
+                if with_similarity:
+                    similarities.append(_token_jaccard(target_tokens, experience.pattern_tokens))
         
-        return similar_experiences
+        return matched_slots, similarities
     
     def _calculate_pattern_similarity(self, pattern1: str, pattern2: str) -> float:
         """パターン類似度の計算"""
-        words1 = set(pattern1.split('_'))
-        words2 = set(pattern2.split('_'))
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)  # Jaccard類似度
+        return _token_jaccard(_pattern_tokens(pattern1), _pattern_tokens(pattern2))  # Jaccard類似度
     
     def _calculate_relevance_score(self, target_pattern: str, experience: Experience) -> float:
         """関連度スコアの計算"""
@@ -414,30 +875,17 @@ class AdaptiveMemory:
         
         return base_similarity + reinforcement_boost + success_boost
     
-    def _calculate_freshness_score(self, experience: Experience) -> float:
+    def _calculate_freshness_score(self, experience: Experience, now: Optional[float] = None) -> float:
         """新鮮さスコアの計算（時間減衰）"""
-        time_diff = datetime.now() - experience.timestamp
-        days_old = time_diff.total_seconds() / (24 * 3600)
+        if now is None:
+            now = time.time()
         
         # 指数減衰（半減期: 7日）
-        return math.exp(-days_old / 7.0)
+        return math.exp((experience.timestamp_seconds - now) / _FRESHNESS_DECAY_SECONDS)
     
-    async def _update_semantic_memory(self, task_pattern: str, task_type: str, experience: Experience):
+    def _update_semantic_memory(self, task_pattern: str, task_type: str, experience: Experience) -> None:
         """意味記憶の更新"""
-        pattern_key = f"{task_type}:{task_pattern}"
-        
-        if pattern_key not in self.semantic_memory:
-            self.semantic_memory[pattern_key] = {
-                'success_rate': 0.0,
-                'total_attempts': 0,
-                'successful_attempts': 0,
-                'average_execution_time': 0.0,
-                'emotional_variance': 0.0,
-                'common_threats': defaultdict(int),
-                'confidence': 0.0
-            }
-        
-        pattern_data = self.semantic_memory[pattern_key]
+        pattern_data = self.semantic_memory[f"{task_type}:{task_pattern}"]
         pattern_data['total_attempts'] += 1
         
         if experience.success:
@@ -454,40 +902,48 @@ class AdaptiveMemory:
         )
         
         # 脅威情報の更新
-        pattern_data['common_threats'][experience.threat_assessment.name] += 1
+        pattern_data['common_threats'][experience.threat_assessment.value - 1] += 1
         
         # 信頼度の計算
         pattern_data['confidence'] = min(pattern_data['total_attempts'] / 10.0, 1.0)
         
         self.memory_stats['pattern_learning_count'] += 1
     
-    async def _manage_memory_capacity(self):
+    def _manage_memory_capacity(self) -> None:
         """記憶容量の管理"""
-        if len(self.episodic_memory) > self.max_episodic_memories:
+        memories_to_remove = len(self.episodic_memory) - self.max_episodic_memories
+        if memories_to_remove > 0:
             # 古い記憶の削除（LRU + 重要度考慮）
-            memories_to_remove = len(self.episodic_memory) - self.max_episodic_memories
-            
-            # 重要度スコアの計算
-            memory_scores = []
-            for memory_id, experience in self.episodic_memory.items():
-                importance_score = (
-                    experience.reinforcement_count * 0.3 +
-                    (1.0 if experience.success else 0.5) * 0.2 +
-                    abs(experience.emotional_impact) * 0.3 +
-                    self._calculate_freshness_score(experience) * 0.2
-                )
-                memory_scores.append((importance_score, memory_id))
+            live_slots = np.flatnonzero(self._exp_live[:self._slot_count])
+            
+            # 重要度スコアの計算（SoA配列上でベクトル化）
+            freshness_scores = np.exp((self._exp_timestamps[live_slots] - time.time()) / _FRESHNESS_DECAY_SECONDS)
+            importance_scores = (
+                self._exp_reinforcement[live_slots] * 0.3 +
+                np.where(self._exp_success[live_slots], 1.0, 0.5) * 0.2 +
+                self._exp_impact_abs[live_slots] * 0.3 +
+                freshness_scores * 0.2
+            )
             
-            # 重要度が低い記憶を削除
-            memory_scores.sort()
-            for _, memory_id in memory_scores[:memories_to_remove]:
+            # 重要度が低い記憶を削除（全体ソートせず下位のみ選択）
+            if memories_to_remove < len(live_slots):
+                lowest = np.argpartition(importance_scores, memories_to_remove - 1)[:memories_to_remove]
+                live_slots = live_slots[lowest]
+            
+            for slot in live_slots:
+                memory_id = self._slot_experiences[slot].task_id
                 del self.episodic_memory[memory_id]
+                self._unindex_experience(memory_id)
             
             self.memory_stats['memory_consolidations'] += 1
     
-    def get_memory_statistics(self) -> Dict[str, Any]:
-        """記憶統計の取得"""
-        return {
+    def get_memory_statistics(self) -> Mapping[str, Any]:
+        """記憶統計の取得（読み取り専用、記憶の更新がなければキャッシュを返す）"""
+        if self._statistics_version == self.stats_version:
+            return self._statistics
+        
+        self._statistics_version = self.stats_version
+        self._statistics = MappingProxyType({
             'episodic_memory_size': len(self.episodic_memory),
             'semantic_patterns': len(self.semantic_memory),
             'working_memory_size': len(self.working_memory),
@@ -497,11 +953,16 @@ class AdaptiveMemory:
             'total_experiences': self.memory_stats['total_experiences'],
             'pattern_learning_count': self.memory_stats['pattern_learning_count'],
             'memory_consolidations': self.memory_stats['memory_consolidations']
-        }
+        })
+        return self._statistics
 
 class RewardSystem:
     """報酬系 - 成功体験に基づく動機付けシステム"""
     
+    __slots__ = ('reward_weights', 'reward_history_capacity', 'recent_reward_window',
+                 '_reward_history', '_reward_head', '_reward_count', '_recent_reward_sum',
+                 'expected_rewards', 'expected_reward_count', 'stats_version')
+    
     def __init__(self):
         self.reward_weights = {
             'task_success': 1.0,
@@ -511,42 +972,45 @@ class RewardSystem:
             'learning_achievement': 0.8
         }
         
-        # 報酬履歴
-        self.reward_history = deque(maxlen=1000)
+        # 報酬履歴（総報酬のリングバッファ + 直近10件の移動和）
+        self.reward_history_capacity = 1000
+        self.recent_reward_window = 10
+        self._reward_history = np.zeros(self.reward_history_capacity, dtype=np.float64)
+        self._reward_head = 0
+        self._reward_count = 0
+        self._recent_reward_sum = 0.0
         
         # 期待値学習
         self.expected_rewards = defaultdict(float)
+        self.expected_reward_count = 0  # len(expected_rewards)のキャッシュ
+        
+        self.stats_version = 0  # 報酬履歴数・期待値パターン数が変わるたびに加算
         
-    async def calculate_reward(self, task_result: Dict[str, Any], emotional_context: EmotionalContext) -> float:
+    def calculate_reward(self, task_result: Dict[str, Any], emotional_context: EmotionalContext) -> float:
         """報酬の計算"""
         try:
             total_reward = 0.0
-            reward_components = {}
             
             # 基本成功報酬
             if task_result.get('success', False):
                 success_reward = self.reward_weights['task_success']
                 total_reward += success_reward
-                reward_components['success'] = success_reward
             
             # 実行速度報酬
             execution_time = task_result.get('execution_time', 30.0)
             if execution_time < 10.0:  # 10秒未満で完了
                 speed_reward = self.reward_weights['execution_speed'] * (10.0 - execution_time) / 10.0
                 total_reward += speed_reward
-                reward_components['speed'] = speed_reward
             
             # 品質報酬
             quality = task_result.get('quality', 0.5)
             quality_reward = quality * self.reward_weights['user_satisfaction']
             total_reward += quality_reward
-            reward_components['quality'] = quality_reward
             
             # 感情的ボーナス
             if emotional_context.state == EmotionalState.CONFIDENT:
                 confidence_bonus = 0.2
                 total_reward += confidence_bonus
-                reward_components['confidence'] = confidence_bonus
             
             # 脅威レベルによるペナルティ/ボーナス
             if emotional_context.threat_level == ThreatLevel.CRITICAL:
@@ -555,53 +1019,132 @@ class RewardSystem:
                 total_reward += 0.1   # 安全タスクのボーナス
             
             # 報酬履歴に記録
-            reward_record = {
-                'timestamp': datetime.now(),
-                'total_reward': total_reward,
-                'components': reward_components,
-                'task_type': task_result.get('task_type', 'unknown')
-            }
-            self.reward_history.append(reward_record)
+            self._record_reward(total_reward)
             
             return max(total_reward, 0.0)  # 負の報酬は0にクリップ
             
         except Exception as e:
-            logging.error(f"❌ 報酬計算エラー: {e}")
+            logging.error("❌ 報酬計算エラー: %s", e)
             return 0.0
     
-    async def update_expectations(self, task_pattern: str, actual_reward: float):
+    def _record_reward(self, total_reward: float) -> None:
+        """リングバッファへの記録と直近ウィンドウの移動和の更新"""
+        capacity = self.reward_history_capacity
+        if self._reward_count >= self.recent_reward_window:
+            # ウィンドウから外れる最古の報酬を差し引く
+            self._recent_reward_sum -= self._reward_history[(self._reward_head - self.recent_reward_window) % capacity]
+        self._recent_reward_sum += total_reward
+        
+        self._reward_history[self._reward_head] = total_reward
+        self._reward_head = (self._reward_head + 1) % capacity
+        if self._reward_count < capacity:
+            self._reward_count += 1
+            self.stats_version += 1
+    
+    @property
+    def reward_history_size(self) -> int:
+        """記録済み報酬数"""
+        return self._reward_count
+    
+    def update_expectations(self, task_pattern: str, actual_reward: float) -> None:
         """期待報酬の更新"""
         learning_rate = 0.1
-        current_expectation = self.expected_rewards[task_pattern]
+        current_expectation = self.expected_rewards.get(task_pattern)
+        if current_expectation is None:
+            current_expectation = 0.0
+            self.expected_reward_count += 1
+            self.stats_version += 1
         
         # TD学習による期待値更新
         prediction_error = actual_reward - current_expectation
-        self.expected_rewards[task_pattern] += learning_rate * prediction_error
+        self.expected_rewards[task_pattern] = current_expectation + learning_rate * prediction_error
     
     def get_motivation_level(self, task_pattern: str) -> float:
         """動機レベルの計算"""
         expected_reward = self.expected_rewards.get(task_pattern, 0.5)
         
         # 最近の報酬平均
-        recent_rewards = [r['total_reward'] for r in list(self.reward_history)[-10:]]
-        avg_recent_reward = sum(recent_rewards) / max(len(recent_rewards), 1)
+        avg_recent_reward = self._recent_reward_sum / max(min(self._reward_count, self.recent_reward_window), 1)
         
         # 動機レベル = 期待報酬 + 最近のパフォーマンス
         motivation = (expected_reward + avg_recent_reward) / 2.0
         
-        return min(max(motivation, 0.0), 1.0)  # 0-1にクリップ
+        # 0-1にクリップ（min/maxの関数呼び出しを避けて比較のみ）
+        return 0.0 if motivation < 0.0 else (1.0 if motivation > 1.0 else motivation)
+
+class EmotionalSystemRegistry:
+    """複数の感情処理システム（エージェント別）の統計集計 - 各システムの件数を索引別の並列配列で保持"""
+    
+    __slots__ = ('history_sizes', 'learned_threat_counts', 'reward_history_sizes',
+                 'experience_counts', '_count')
+    
+    def __init__(self, initial_capacity: int = 16):
+        self.history_sizes = np.zeros(initial_capacity, dtype=np.int64)
+        self.learned_threat_counts = np.zeros(initial_capacity, dtype=np.int64)
+        self.reward_history_sizes = np.zeros(initial_capacity, dtype=np.int64)
+        self.experience_counts = np.zeros(initial_capacity, dtype=np.int64)
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def register(self) -> int:
+        """新しいシステムの索引を払い出す（容量不足時は配列を倍に拡張）"""
+        index = self._count
+        capacity = len(self.history_sizes)
+        if index >= capacity:
+            extra = max(capacity, 1)
+            self.history_sizes = np.concatenate((self.history_sizes, np.zeros(extra, dtype=np.int64)))
+            self.learned_threat_counts = np.concatenate((self.learned_threat_counts, np.zeros(extra, dtype=np.int64)))
+            self.reward_history_sizes = np.concatenate((self.reward_history_sizes, np.zeros(extra, dtype=np.int64)))
+            self.experience_counts = np.concatenate((self.experience_counts, np.zeros(extra, dtype=np.int64)))
+        self._count = index + 1
+        return index
+    
+    def update(self, index: int, history_size: int, learned_threats: int,
+               reward_history_size: int, experiences: int):
+        """索引のシステムの件数を書き込む"""
+        self.history_sizes[index] = history_size
+        self.learned_threat_counts[index] = learned_threats
+        self.reward_history_sizes[index] = reward_history_size
+        self.experience_counts[index] = experiences
+    
+    def get_aggregate_statistics(self) -> Dict[str, int]:
+        """登録済み全システムの合計（配列ごとの一括集計）"""
+        count = self._count
+        return {
+            'systems': count,
+            'emotional_history_size': int(self.history_sizes[:count].sum()),
+            'learned_threats': int(self.learned_threat_counts[:count].sum()),
+            'reward_history_size': int(self.reward_history_sizes[:count].sum()),
+            'total_experiences': int(self.experience_counts[:count].sum())
+        }
 
 class EmotionalProcessingSystem:
     """感情処理システム - 大脳辺縁系の統合機能"""
     
-    def __init__(self):
+    __slots__ = ('threat_detector', 'memory_manager', 'reward_system', 'current_emotional_state',
+                 '_current_state_str', 'emotional_history', '_emotional_history_size',
+                 '_stats_version', '_stats_versions', '_stats', 'emotional_weights',
+                 'registry', 'registry_index')
+    
+    def __init__(self, max_emotional_history: int = 100,
+                 registry: Optional[EmotionalSystemRegistry] = None):
         self.threat_detector = ThreatDetector()
         self.memory_manager = AdaptiveMemory()
         self.reward_system = RewardSystem()
         
         # 現在の感情状態
         self.current_emotional_state = EmotionalState.NEUTRAL
-        self.emotional_history = deque(maxlen=100)
+        self._current_state_str = self.current_emotional_state.label  # 状態更新時に文字列も保持
+        # 感情履歴（直近のみ保持するローリングウィンドウ）
+        self.emotional_history = deque(maxlen=max_emotional_history)
+        self._emotional_history_size = 0  # len(emotional_history)のキャッシュ
+        self._stats_version = 0  # 感情状態・履歴の更新ごとに加算
+        
+        # 統計情報のキャッシュ（構成要素のバージョンが変わった場合のみ再作成）
+        self._stats_versions = None
+        self._stats: Optional[EmotionalStatistics] = None
         
         # 感情的重み付けパラメータ
         self.emotional_weights = {
@@ -609,67 +1152,113 @@ class EmotionalProcessingSystem:
             'memory_influence': 0.3,
             'reward_influence': 0.3
         }
+        
+        # 集計用レジストリ（複数エージェントの統計を一括集計する場合のみ）
+        self.registry = registry
+        self.registry_index = registry.register() if registry is not None else -1
     
     async def evaluate_task_emotion(self, task_description: str, task_type: str = "general") -> EmotionalContext:
         """タスクの感情的重みを評価"""
+        now = datetime.now()
         try:
             # 脅威評価
-            threat_level, threat_score, threat_details = await self.threat_detector.assess_threat(
+            threat_level, threat_score, threat_details = self.threat_detector.assess_threat(
                 task_description, task_type
             )
             
-            # 過去の経験想起
-            past_experiences = await self.memory_manager.recall_similar_experiences(
-                task_description, task_type, limit=5
-            )
-            
-            # 感情的重みの計算
-            emotional_weight = await self._calculate_emotional_significance(
-                threat_level, threat_score, past_experiences, task_description
-            )
+            return self._build_emotional_context(task_description, task_type, threat_level, threat_score, now)
             
-            # 信頼度の計算
-            confidence = self._calculate_confidence(past_experiences)
-            
-            # 感情価値（valence）と覚醒度（arousal）の計算
-            valence, arousal = self._calculate_emotional_dimensions(
-                threat_level, past_experiences, emotional_weight
-            )
-            
-            # 感情状態の判定
-            emotional_state = self._determine_emotional_state(valence, arousal, threat_level)
-            
-            # 感情的文脈の作成
-            emotional_context = EmotionalContext(
-                threat_level=threat_level,
-                emotional_weight=emotional_weight,
-                confidence=confidence,
-                valence=valence,
-                arousal=arousal,
-                state=emotional_state,
-                timestamp=datetime.now()
+        except Exception as e:
+            logging.error("❌ 感情評価エラー: %s", e)
+            return self._default_emotional_context(now)
+    
+    async def evaluate_task_emotions_batch(self, task_descriptions: List[str],
+                                           task_types: Optional[List[str]] = None) -> List[EmotionalContext]:
+        """複数タスクの感情的重みを一括評価（脅威評価をまとめて実行）"""
+        if task_types is None:
+            task_types = ["general"] * len(task_descriptions)
+        
+        now = datetime.now()
+        try:
+            threat_levels, threat_scores, _ = self.threat_detector.assess_threats_batch(
+                task_descriptions, task_types
             )
             
-            # 感情履歴に記録
-            self.emotional_history.append(emotional_context)
-            self.current_emotional_state = emotional_state
-            
-            logging.info(f"💭 感情評価: {task_description[:50]}... -> {emotional_state.value} "
-                        f"(脅威: {threat_level.name}, 重み: {emotional_weight:.2f}, 信頼度: {confidence:.2f})")
-            
-            return emotional_context
+            contexts = []
+            for task_description, task_type, threat_level, threat_score in zip(
+                task_descriptions, task_types, threat_levels, threat_scores.tolist()
+            ):
+                contexts.append(
+                    self._build_emotional_context(task_description, task_type, threat_level, threat_score, now)
+                )
+            return contexts
             
         except Exception as e:
-            logging.error(f"❌ 感情評価エラー: {e}")
-            return EmotionalContext(
-                threat_level=ThreatLevel.MODERATE,
-                emotional_weight=0.5,
-                confidence=0.0,
-                valence=0.0,
-                arousal=0.5,
-                state=EmotionalState.NEUTRAL,
-                timestamp=datetime.now()
-            )
+            logging.error("❌ 感情一括評価エラー: %s", e)
+            return [self._default_emotional_context(now) for _ in task_descriptions]
+    
+    def _build_emotional_context(self, task_description: str, task_type: str,
+                                 threat_level: ThreatLevel, threat_score: float,
+                                 now: datetime) -> EmotionalContext:
+        """脅威評価結果と過去の経験から感情的文脈を作成"""
+        # 過去の経験想起
+        past_experiences = self.memory_manager.recall_similar_experiences(
+            task_description, task_type, limit=5
+        )
+        
+        # 感情的重みの計算
+        emotional_weight = self._calculate_emotional_significance(
+            threat_level, threat_score, past_experiences, task_description
+        )
+        
+        # 信頼度の計算
+        confidence = self._calculate_confidence(past_experiences)
+        
+        # 感情価値（valence）と覚醒度（arousal）の計算
+        valence, arousal = self._calculate_emotional_dimensions(
+            threat_level, past_experiences, emotional_weight
+        )
+        
+        # 感情状態の判定
+        emotional_state = self._determine_emotional_state(valence, arousal, threat_level)
+        
+        # 感情的文脈の作成
+        emotional_context = EmotionalContext(
+            threat_level=threat_level,
+            emotional_weight=emotional_weight,
+            confidence=confidence,
+            valence=valence,
+            arousal=arousal,
+            state=emotional_state,
+            timestamp=now
+        )
+        
+        # 感情履歴に記録
+        self.emotional_history.append(emotional_context)
+        if self._emotional_history_size < self.emotional_history.maxlen:
+            self._emotional_history_size += 1
+        self.current_emotional_state = emotional_state
+        self._current_state_str = emotional_state.label
+        self._stats_version += 1
+        if self.registry is not None:
+            self.registry.history_sizes[self.registry_index] = self._emotional_history_size
+        
+        logging.info("💭 感情評価: %s... -> %s (脅威: %s, 重み: %.2f, 信頼度: %.2f)",
+                     task_description[:50], emotional_state.label, threat_level.name, emotional_weight, confidence)
+        
+        return emotional_context
+    
+    def _default_emotional_context(self, now: datetime) -> EmotionalContext:
+        """評価失敗時の既定の感情的文脈"""
+        return EmotionalContext(
+            threat_level=ThreatLevel.MODERATE,
+            emotional_weight=0.5,
+            confidence=0.0,
+            valence=0.0,
+            arousal=0.5,
+            state=EmotionalState.NEUTRAL,
+            timestamp=now
+        )
     
     async def process_task_outcome(self, task_id: str, task_description: str, task_type: str,
                                   task_result: Dict[str, Any], emotional_context: EmotionalContext):
@@ -681,47 +1270,49 @@ class EmotionalProcessingSystem:
             result_quality = task_result.get('quality', 0.5 if success else 0.1)
             
             # 報酬計算
-            reward = await self.reward_system.calculate_reward(task_result, emotional_context)
+            reward = self.reward_system.calculate_reward(task_result, emotional_context)
+            
+            # タスクパターンの抽出（記憶保存と期待報酬更新で共用）
+            task_pattern = self.memory_manager._extract_task_pattern(task_description, task_type)
             
             # 記憶への保存
-            await self.memory_manager.store_experience(
+            self.memory_manager.store_experience(
                 task_id, task_description, task_type,
-                result_quality, success, execution_time, emotional_context
+                result_quality, success, execution_time, emotional_context,
+                task_pattern=task_pattern
             )
             
             # 脅威検知器の学習
             impact_severity = 1.0 - result_quality if not success else 0.0
-            await self.threat_detector.learn_from_outcome(
+            self.threat_detector.learn_from_outcome(
                 task_description, success, impact_severity
             )
             
             # 期待報酬の更新
-            task_pattern = self.memory_manager._extract_task_pattern(task_description, task_type)
-            await self.reward_system.update_expectations(task_pattern, reward)
+            self.reward_system.update_expectations(task_pattern, reward)
+            
+            if self.registry is not None:
+                self._publish_to_registry()
             
-            logging.info(f"🎯 結果処理: {task_id} -> 成功: {success}, 報酬: {reward:.2f}")
+            logging.info("🎯 結果処理: %s -> 成功: %s, 報酬: %.2f", task_id, success, reward)
             
         except Exception as e:
-            logging.error(f"❌ 結果処理エラー: {e}")
+            logging.error("❌ 結果処理エラー: %s", e)
     
-    async def _calculate_emotional_significance(self, threat_level: ThreatLevel, 
-                                              threat_score: float, past_experiences: List[Experience],
-                                              task_description: str = "") -> float:
+    def _calculate_emotional_significance(self, threat_level: ThreatLevel, 
+                                        threat_score: float, past_experiences: List[Experience],
+                                        task_description: str = "") -> float:
         """感情的重要度の計算"""
         # 脅威による重み
         threat_weight = threat_score / 10.0  # 正規化
         
         # 過去の経験による重み
         if past_experiences:
-            experience_weights = []
-            for exp in past_experiences:
-                # 失敗体験は重みを増加
-                exp_weight = abs(exp.emotional_impact)
-                if not exp.success:
-                    exp_weight *= 1.5
-                experience_weights.append(exp_weight)
-            
-            avg_experience_weight = sum(experience_weights) / len(experience_weights)
+            # 失敗体験は重みを増加
+            avg_experience_weight = sum(
+                exp.emotional_impact_abs if exp.success else exp.emotional_impact_abs * 1.5
+                for exp in past_experiences
+            ) / len(past_experiences)
         else:
             avg_experience_weight = 0.5  # デフォルト
         
@@ -740,7 +1331,7 @@ class EmotionalProcessingSystem:
             positive_boost * self.emotional_weights['reward_influence']
         )
         
-        return min(max(emotional_significance, 0.0), 1.0)
+        return 0.0 if emotional_significance < 0.0 else (1.0 if emotional_significance > 1.0 else emotional_significance)
     
     def _calculate_confidence(self, past_experiences: List[Experience]) -> float:
         """信頼度の計算"""
@@ -767,27 +1358,17 @@ class EmotionalProcessingSystem:
             success_rate = sum(1 for exp in past_experiences if exp.success) / len(past_experiences)
             valence = (success_rate - 0.5) * 2.0  # -1.0 to 1.0
         
-        # 脅威による価値の調整
-        if threat_level == ThreatLevel.SAFE:
-            valence += 0.3  # 安全なタスクはポジティブ寄り
-        elif threat_level == ThreatLevel.LOW:
-            valence += 0.1
-        elif threat_level == ThreatLevel.MODERATE:
-            valence -= 0.1  # 中程度の脅威は軽微なネガティブ
-        else:
-            threat_penalty = (threat_level.value - 3) * 0.3  # HIGHから強い罰則
-            valence -= threat_penalty
+        # 脅威による価値の調整（脅威レベル別の表引き）
+        valence += _THREAT_VALENCE_SHIFTS[threat_level]
         
         # 覚醒度（arousal）: 低(0.0) ↔ 高(1.0)
-        arousal = emotional_weight
-        
         # 脅威による覚醒度増加（調整済み）
-        if threat_level == ThreatLevel.MODERATE:
-            arousal += 0.1  # MODERATE脅威は控えめに覚醒度増加
-        else:
-            arousal += (threat_level.value - 1) * 0.15
+        arousal = emotional_weight + _THREAT_AROUSAL_SHIFTS[threat_level]
         
-        return max(min(valence, 1.0), -1.0), max(min(arousal, 1.0), 0.0)
+        return (
+            -1.0 if valence < -1.0 else (1.0 if valence > 1.0 else valence),
+            0.0 if arousal < 0.0 else (1.0 if arousal > 1.0 else arousal)
+        )
     
     def _determine_emotional_state(self, valence: float, arousal: float, 
                                  threat_level: ThreatLevel) -> EmotionalState:
@@ -818,51 +1399,64 @@ class EmotionalProcessingSystem:
     async def get_task_priority_adjustment(self, task_description: str, task_type: str, 
                                          base_priority: float) -> float:
         """感情的評価に基づく優先度調整"""
-        try:
-            emotional_context = await self.evaluate_task_emotion(task_description, task_type)
-            
-            # 脅威レベルによる調整
-            threat_adjustment = 0.0
-            if emotional_context.threat_level == ThreatLevel.CRITICAL:
-                threat_adjustment = -0.3  # 優先度を下げる
-            elif emotional_context.threat_level == ThreatLevel.HIGH:
-                threat_adjustment = -0.1
-            elif emotional_context.threat_level == ThreatLevel.SAFE:
-                threat_adjustment = 0.1   # 優先度を上げる
-            
-            # 信頼度による調整
-            confidence_adjustment = emotional_context.confidence * 0.2
-            
-            # 感情状態による調整
-            state_adjustment = 0.0
-            if emotional_context.state == EmotionalState.CONFIDENT:
-                state_adjustment = 0.15
-            elif emotional_context.state == EmotionalState.FRUSTRATED:
-                state_adjustment = -0.1
-            elif emotional_context.state == EmotionalState.ANXIOUS:
-                state_adjustment = -0.2
-            
-            # 総合調整
-            total_adjustment = threat_adjustment + confidence_adjustment + state_adjustment
-            adjusted_priority = base_priority + total_adjustment
-            
-            return max(min(adjusted_priority, 1.0), 0.0)
-            
-        except Exception as e:
-            logging.error(f"❌ 優先度調整エラー: {e}")
-            return base_priority
+        # evaluate_task_emotionは失敗時も既定の文脈を返し、調整量は表引きの定数なので例外は発生しない
+        emotional_context = await self.evaluate_task_emotion(task_description, task_type)
+        
+        # 脅威レベル・感情状態による調整は表引き、信頼度による調整と合算・クリップは共通の演算
+        return _fuse_priority_adjustment(
+            base_priority,
+            _THREAT_PRIORITY_ADJUSTMENTS.get(emotional_context.threat_level, 0.0),
+            emotional_context.confidence,
+            _STATE_PRIORITY_ADJUSTMENTS[emotional_context.state]
+        )
     
-    def get_emotional_statistics(self) -> Dict[str, Any]:
-        """感情システムの統計情報"""
-        return {
-            'current_state': self.current_emotional_state.value,
-            'threat_detector': {
-                'learned_threats': len(self.threat_detector.learned_threats)
-            },
-            'memory_manager': self.memory_manager.get_memory_statistics(),
-            'reward_system': {
-                'reward_history_size': len(self.reward_system.reward_history),
-                'expected_rewards': len(self.reward_system.expected_rewards)
-            },
-            'emotional_history_size': len(self.emotional_history)
-        }
\ No newline at end of file
+    async def get_task_priority_adjustments_batch(self, task_descriptions: List[str], task_types: List[str],
+                                                  base_priorities: Sequence[float]) -> np.ndarray:
+        """複数候補の優先度を一括調整（感情評価後の調整量計算をベクトル化）"""
+        emotional_contexts = await self.evaluate_task_emotions_batch(task_descriptions, task_types)
+        count = len(emotional_contexts)
+        
+        threat_indices = np.fromiter(
+            (context.threat_level.value - 1 for context in emotional_contexts), dtype=np.intp, count=count
+        )
+        confidences = np.fromiter((context.confidence for context in emotional_contexts), dtype=np.float64, count=count)
+        state_indices = np.fromiter((context.state for context in emotional_contexts), dtype=np.intp, count=count)
+        
+        # 脅威 + 信頼度 + 感情状態の調整を合算し、0-1にクリップ
+        adjusted_priorities = np.asarray(base_priorities, dtype=np.float64) + (
+            _THREAT_PRIORITY_ADJUSTMENT_ARRAY[threat_indices] + confidences * 0.2
+            + _STATE_PRIORITY_ADJUSTMENT_ARRAY[state_indices]
+        )
+        return np.clip(adjusted_priorities, 0.0, 1.0, out=adjusted_priorities)
+    
+    def _publish_to_registry(self):
+        """レジストリの自システムの行を現在の件数で更新"""
+        self.registry.update(
+            self.registry_index,
+            self._emotional_history_size,
+            self.threat_detector.learned_threat_count,
+            self.reward_system.reward_history_size,
+            len(self.memory_manager.episodic_memory)
+        )
+    
+    def get_emotional_statistics(self) -> EmotionalStatistics:
+        """感情システムの統計情報（変更がなければキャッシュを返す）"""
+        versions = (
+            self._stats_version,
+            self.threat_detector.stats_version,
+            self.memory_manager.stats_version,
+            self.reward_system.stats_version
+        )
+        if versions == self._stats_versions:
+            return self._stats
+        
+        self._stats = EmotionalStatistics(
+            current_state=self._current_state_str,
+            learned_threats=self.threat_detector.learned_threat_count,
+            memory_manager=self.memory_manager.get_memory_statistics(),
+            reward_history_size=self.reward_system.reward_history_size,
+            expected_rewards=self.reward_system.expected_reward_count,
+            emotional_history_size=self._emotional_history_size
+        )
+        self._stats_versions = versions
+        return self._stats
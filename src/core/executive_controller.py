@@ -4,16 +4,29 @@ Executive Controller System - 前頭前皮質を模倣した高次認知制御
 """
 
 import asyncio
+import hashlib
 import logging
+from bisect import bisect_right
 import heapq
+import itertools
 import math
-from typing import Dict, Any, List, Optional, Tuple, Union
+import struct
+import sys
+import time
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from operator import attrgetter
 import json
 
+import numpy as np
+
+# slots付きdataclassはPython 3.10以降のみ対応
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class CognitiveLoadLevel(Enum):
     """認知負荷レベル"""
     LOW = 1
@@ -28,15 +41,38 @@ class AttentionType(Enum):
     SUSTAINED = "sustained"    # 持続的注意
     SELECTIVE = "selective"    # 選択的注意
 
-class DecisionStrategy(Enum):
-    """意思決定戦略"""
-    RATIONAL = "rational"      # 合理的分析
-    INTUITIVE = "intuitive"    # 直感的判断
-    HYBRID = "hybrid"          # 混合型
-    EMOTIONAL = "emotional"    # 感情主導
-    CONSERVATIVE = "conservative"  # 保守的
+class DecisionStrategy(IntEnum):
+    """意思決定戦略（連番の整数値で、戦略別の表・統計は戦略で直接索引）"""
+    RATIONAL = 0      # 合理的分析
+    INTUITIVE = 1     # 直感的判断
+    HYBRID = 2        # 混合型
+    EMOTIONAL = 3     # 感情主導
+    CONSERVATIVE = 4  # 保守的
+    
+    @property
+    def label(self) -> str:
+        """表示・統計用の戦略名（例: "rational"）"""
+        return _DECISION_STRATEGY_LABELS[self]
+
+_DECISION_STRATEGY_LABELS: Tuple[str, ...] = tuple(strategy.name.lower() for strategy in DecisionStrategy)
 
-@dataclass
+# 意思決定の各処理で参照する戦略メンバー（Enumの属性参照を避けてモジュール定数に束縛）
+_RATIONAL = DecisionStrategy.RATIONAL
+_INTUITIVE = DecisionStrategy.INTUITIVE
+_HYBRID = DecisionStrategy.HYBRID
+_EMOTIONAL = DecisionStrategy.EMOTIONAL
+_CONSERVATIVE = DecisionStrategy.CONSERVATIVE
+
+# 戦略別の複雑性（タスク難易度の推定に使用、DecisionStrategyの整数値で直接索引）
+_STRATEGY_COMPLEXITY: Tuple[float, ...] = (
+    0.3,  # RATIONAL
+    0.1,  # INTUITIVE
+    0.5,  # HYBRID
+    0.2,  # EMOTIONAL
+    0.4   # CONSERVATIVE
+)
+
+@dataclass(**_DATACLASS_SLOTS)
 class CognitiveTask:
     """認知タスク"""
     task_id: str
@@ -50,8 +86,13 @@ class CognitiveTask:
     deadline: Optional[datetime]
     dependencies: List[str]
     context: Dict[str, Any]
+    deadline_timestamp: float = math.inf  # 締切のエポック秒（締切なしは無限遠）
+    
+    def __post_init__(self):
+        if self.deadline is not None:
+            self.deadline_timestamp = self.deadline.timestamp()
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AttentionResource:
     """注意リソース"""
     total_capacity: float
@@ -60,7 +101,7 @@ class AttentionResource:
     efficiency: float  # 現在の効率
     fatigue_level: float  # 疲労度
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ExecutiveDecision:
     """実行決定"""
     decision_id: str
@@ -72,6 +113,127 @@ class ExecutiveDecision:
     alternatives_considered: List[Dict[str, Any]]
     timestamp: datetime
 
+@dataclass(**_DATACLASS_SLOTS)
+class TaskArrays:
+    """分析用のタスク属性配列（SoA、添字はタスクリストと対応）"""
+    importance: np.ndarray
+    complexity: np.ndarray
+    required_attention: np.ndarray
+    urgency: np.ndarray
+    emotional_weight: np.ndarray
+    is_typical: np.ndarray  # task_typeが'simple'/'qa'
+    is_creative: np.ndarray  # task_typeが'creative'
+
+def _expected_utilities(importance: np.ndarray, complexity: np.ndarray,
+                        required_attention: np.ndarray) -> np.ndarray:
+    """期待効用の数値演算（利益 × 成功確率 - コスト）"""
+    estimated_success_prob = 1.0 - complexity * 0.3
+    expected_benefit = importance * estimated_success_prob
+    estimated_cost = required_attention / 100.0
+    return expected_benefit - estimated_cost
+
+def _intuitive_scores(complexity: np.ndarray, urgency: np.ndarray, is_typical: np.ndarray) -> np.ndarray:
+    """ヒューリスティック評価の数値演算（認識しやすさ・代表性・アンカリングの平均）"""
+    familiarity = 1.0 - complexity                       # availability heuristic
+    typical_pattern = np.where(is_typical, 0.7, 0.5)     # representativeness heuristic
+    anchor_adjustment = urgency * 0.8                    # アンカリング効果
+    return (familiarity + typical_pattern + anchor_adjustment) / 3.0
+
+def _emotional_scores(emotional_weight: np.ndarray, complexity: np.ndarray,
+                      importance: np.ndarray, is_creative: np.ndarray) -> np.ndarray:
+    """感情的評価の数値演算（感情的重み・ストレス軽減・達成感の平均）"""
+    stress_relief = np.where(is_creative, 1.0 - complexity, 0.3)
+    achievement_feeling = importance * 0.8
+    return (emotional_weight + stress_relief + achievement_feeling) / 3.0
+
+def _top_scored(scores: np.ndarray, tasks: List[CognitiveTask], k: int = 3) -> List[Tuple[float, CognitiveTask]]:
+    """スコア降順（同点は入力順）の上位k件を(スコア, タスク)で返す"""
+    negated = -scores
+    if k < len(negated):
+        # 全体ソートを避け、k番目のスコア以上の候補（境界の同点を含む）だけを並べ替える
+        threshold = np.partition(negated, k - 1)[k - 1]
+        candidates = np.flatnonzero(negated <= threshold)
+        order = candidates[np.argsort(negated[candidates], kind='stable')[:k]]
+    else:
+        order = np.argsort(negated, kind='stable')
+    return [(score, tasks[index]) for score, index in zip(scores[order].tolist(), order.tolist())]
+
+# 分析・キャッシュキーが参照するタスクの数値属性（1回の呼び出しでまとめて取得）
+_task_numeric_fields = attrgetter('urgency', 'importance', 'complexity', 'required_attention', 'emotional_weight')
+
+# 意思決定キャッシュキーのタスク要約形式（文字列長、数値フィールドはfloat64のまま）
+_TASK_SIGNATURE_HEADER = struct.Struct('<II')
+_TASK_SIGNATURE_FIELDS = struct.Struct('<5d')
+
+# 評価結果の完全なキー構成と既定値（分析失敗時や不完全な評価の補完に使用）
+_EVALUATION_DEFAULTS: Dict[str, Any] = {
+    'strategy': _RATIONAL,
+    'recommended_task': None,
+    'confidence': 0.5,
+    'rationale': 'Default decision',
+    'evaluation_details': ()
+}
+
+def _failed_evaluation(strategy: DecisionStrategy) -> Dict[str, Any]:
+    """分析失敗時の評価結果（低信頼度、推奨タスクなし）"""
+    return {**_EVALUATION_DEFAULTS, 'strategy': strategy, 'confidence': 0.1}
+
+# 汎用的競合解決の多基準意思決定分析（MCDA）の基準と重み
+_MCDA_CRITERIA: Tuple[str, ...] = ('priority', 'expected_value', 'confidence', 'emotional_weight', 'efficiency')
+_MCDA_WEIGHTS = np.array([0.3, 0.25, 0.2, 0.15, 0.1], dtype=np.float64)
+
+def _new_memory_item() -> Dict[str, Any]:
+    """作業記憶項目の空の辞書（プール用）"""
+    return {'content': None, 'timestamp': None, 'access_count': 0, 'importance': 0.0, 'search_text': ''}
+
+# 作業記憶の検索索引で項目の検索用文字列を連結する区切り文字
+_SEARCH_SEPARATOR = "\x00"
+
+class _ColumnarHistory:
+    """固定長の履歴リングバッファ（列ごとのNumPy配列に保持し、集計は列単位で行う）"""
+    
+    __slots__ = ('capacity', 'fields', '_columns', '_head', '_count')
+    
+    def __init__(self, capacity: int, columns: Dict[str, Any]):
+        self.capacity = capacity
+        self.fields: Tuple[str, ...] = tuple(columns)
+        self._columns = tuple(np.empty(capacity, dtype=dtype) for dtype in columns.values())
+        self._head = 0
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, *values):
+        """1件追加（容量超過時は最古の記録を上書き）"""
+        head = self._head
+        for column, value in zip(self._columns, values):
+            column[head] = value
+        self._head = (head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+    
+    def column(self, field: str) -> np.ndarray:
+        """古い順に並べた列のコピー"""
+        column = self._columns[self.fields.index(field)]
+        if self._count < self.capacity:
+            return column[:self._count].copy()
+        return np.roll(column, -self._head)
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """古い順のindex番目（負数は新しい側から）の記録を辞書で返す"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+        position = (self._head - self._count + index) % self.capacity
+        return {field: column[position].item() if column.dtype != object else column[position]
+                for field, column in zip(self.fields, self._columns)}
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """全記録を古い順に辞書のリストで返す"""
+        return [self[index] for index in range(self._count)]
+
 class WorkingMemory:
     """作業記憶システム"""
     
@@ -82,6 +244,17 @@ class WorkingMemory:
         self.episodic_buffer = deque(maxlen=capacity)  # エピソード情報
         self.central_executive_state = {}
         
+        # コンテキストのキャッシュ（項目追加ごとに加算されるバージョンが変わった場合のみ再作成）
+        self.stats_version = 0
+        self._context_version = -1
+        self._context: Mapping[str, Any] = MappingProxyType({})
+        
+        # 押し出された記憶項目の辞書を再利用するプール（定常状態で新規の辞書を作らない）
+        self._item_pool: deque = deque(_new_memory_item() for _ in range(capacity * 3 + 8))
+        
+        # バッファ別の検索索引（検索用文字列の連結と各項目の開始位置、追加時に破棄し検索時に再構築）
+        self._search_indexes: Dict[str, Tuple[str, List[int]]] = {}
+        
         # 作業記憶の統計
         self.usage_stats = {
             'total_items_processed': 0,
@@ -90,67 +263,91 @@ class WorkingMemory:
             'interference_events': 0
         }
     
-    def add_item(self, item: Any, memory_type: str = "episodic") -> bool:
-        """作業記憶への項目追加"""
+    def add_item(self, item: Any, memory_type: str = "episodic",
+                 current_time: Optional[datetime] = None) -> bool:
+        """作業記憶への項目追加（current_time省略時は現在時刻）"""
         try:
-            current_time = datetime.now()
-            memory_item = {
-                'content': item,
-                'timestamp': current_time,
-                'access_count': 0,
-                'importance': getattr(item, 'importance', 0.5)
-            }
+            if current_time is None:
+                current_time = datetime.now()
+            memory_item = self._item_pool.popleft() if self._item_pool else _new_memory_item()
+            memory_item['content'] = item
+            memory_item['timestamp'] = current_time
+            memory_item['access_count'] = 0
+            memory_item['importance'] = getattr(item, 'importance', 0.5)
+            memory_item['search_text'] = str(item).lower()  # 検索用の文字列は追加時に1度だけ作成
             
-            if memory_type == "phonological":
-                if len(self.phonological_loop) >= self.capacity:
-                    self._handle_capacity_overflow("phonological")
-                self.phonological_loop.append(memory_item)
-                
-            elif memory_type == "visuospatial":
-                if len(self.visuospatial_sketchpad) >= self.capacity:
-                    self._handle_capacity_overflow("visuospatial")
-                self.visuospatial_sketchpad.append(memory_item)
-                
-            else:  # episodic
-                if len(self.episodic_buffer) >= self.capacity:
-                    self._handle_capacity_overflow("episodic")
-                self.episodic_buffer.append(memory_item)
+            buffer_name = self._buffer_name(memory_type)
+            target_buffer = self._get_buffer(buffer_name)
+            evicted_item = None
+            if len(target_buffer) >= self.capacity:
+                self._handle_capacity_overflow(buffer_name)
+                if len(target_buffer) == target_buffer.maxlen:
+                    evicted_item = target_buffer[0]  # appendで押し出される最古の項目
+            target_buffer.append(memory_item)
             
+            if evicted_item is not None:
+                # 参照を外してプールへ戻す
+                evicted_item['content'] = None
+                evicted_item['timestamp'] = None
+                evicted_item['search_text'] = ''
+                self._item_pool.append(evicted_item)
+            
+            self._search_indexes.pop(buffer_name, None)
+            self.stats_version += 1
             self.usage_stats['total_items_processed'] += 1
             self._update_load_stats()
             
             return True
             
         except Exception as e:
-            logging.error(f"❌ 作業記憶追加エラー: {e}")
+            logging.error("❌ 作業記憶追加エラー: %s", e)
             return False
     
     def retrieve_item(self, query: str, memory_type: str = "episodic") -> Optional[Any]:
         """作業記憶からの項目検索"""
         try:
             target_buffer = self._get_buffer(memory_type)
+            if not target_buffer:
+                return None
+            query_lower = query.lower()
             
-            for item in reversed(target_buffer):  # 最新から検索
-                if self._matches_query(item['content'], query):
-                    item['access_count'] += 1
-                    return item['content']
+            if _SEARCH_SEPARATOR in query_lower:
+                # 区切り文字を含むクエリは索引を使えないため逐次照合
+                for item in reversed(target_buffer):  # 最新から検索
+                    if self._matches_query(item, query_lower):
+                        item['access_count'] += 1
+                        return item['content']
+                return None
             
-            return None
+            # 連結文字列を末尾から1回検索し、一致位置から最新の該当項目を特定
+            search_text, item_starts = self._get_search_index(memory_type, target_buffer)
+            position = search_text.rfind(query_lower)
+            if position < 0:
+                return None
+            
+            item = target_buffer[bisect_right(item_starts, position) - 1]
+            item['access_count'] += 1
+            return item['content']
             
         except Exception as e:
-            logging.error(f"❌ 作業記憶検索エラー: {e}")
+            logging.error("❌ 作業記憶検索エラー: %s", e)
             return None
     
-    def get_current_context(self) -> Dict[str, Any]:
-        """現在の作業記憶コンテキスト"""
-        return {
+    def get_current_context(self) -> Mapping[str, Any]:
+        """現在の作業記憶コンテキスト（読み取り専用、項目追加がなければキャッシュを返す）"""
+        if self._context_version == self.stats_version:
+            return self._context
+        
+        self._context_version = self.stats_version
+        self._context = MappingProxyType({
             'phonological_items': len(self.phonological_loop),
             'visuospatial_items': len(self.visuospatial_sketchpad),
             'episodic_items': len(self.episodic_buffer),
             'total_load': self.get_cognitive_load(),
             'efficiency': self._calculate_efficiency(),
-            'executive_state': self.central_executive_state.copy()
-        }
+            'executive_state': MappingProxyType(self.central_executive_state)  # 常に最新を反映するビュー
+        })
+        return self._context
     
     def get_cognitive_load(self) -> float:
         """現在の認知負荷を計算"""
@@ -161,6 +358,24 @@ class WorkingMemory:
         )
         return min(total_items / (self.capacity * 3), 1.0)
     
+    def _buffer_name(self, memory_type: str) -> str:
+        """メモリタイプの正規化（未知のタイプはepisodic）"""
+        return memory_type if memory_type in ("phonological", "visuospatial") else "episodic"
+    
+    def _get_search_index(self, memory_type: str, target_buffer: deque) -> Tuple[str, List[int]]:
+        """バッファの検索索引を取得（未構築なら検索用文字列を区切り文字で連結して作成）"""
+        buffer_name = self._buffer_name(memory_type)
+        search_index = self._search_indexes.get(buffer_name)
+        if search_index is None:
+            item_starts = []
+            offset = 0
+            for item in target_buffer:
+                item_starts.append(offset)
+                offset += len(item['search_text']) + len(_SEARCH_SEPARATOR)
+            search_text = _SEARCH_SEPARATOR.join(item['search_text'] for item in target_buffer)
+            search_index = self._search_indexes[buffer_name] = (search_text, item_starts)
+        return search_index
+    
     def _get_buffer(self, memory_type: str):
         """メモリタイプに対応するバッファを取得"""
         if memory_type == "phonological":
@@ -176,10 +391,9 @@ class WorkingMemory:
         # LRU (Least Recently Used) ベースで古い項目を削除
         # dequeの性質上、自動的に古い項目が削除される
     
-    def _matches_query(self, content: Any, query: str) -> bool:
-        """クエリとコンテンツのマッチング"""
-        content_str = str(content).lower()
-        return query.lower() in content_str
+    def _matches_query(self, memory_item: Dict[str, Any], query_lower: str) -> bool:
+        """クエリ（小文字化済み）と記憶項目のマッチング"""
+        return query_lower in memory_item['search_text']
     
     def _calculate_efficiency(self) -> float:
         """作業記憶の効率を計算"""
@@ -201,6 +415,9 @@ class AttentionManager:
     """注意管理システム"""
     
     def __init__(self, total_attention_capacity: float = 100.0):
+        # ヒープ項目の同順位タイブレーカー（CognitiveTask同士の比較を避ける）
+        self._heap_counter = itertools.count()
+        
         self.attention_resource = AttentionResource(
             total_capacity=total_attention_capacity,
             allocated=0.0,
@@ -211,7 +428,10 @@ class AttentionManager:
         
         self.active_tasks: Dict[str, CognitiveTask] = {}
         self.priority_queue = []  # heapqを使用
-        self.attention_history = deque(maxlen=1000)
+        # 注意配分の履歴（列指向、timestampはエポック秒）
+        self.attention_history = _ColumnarHistory(1000, {
+            'task_id': object, 'allocated': np.float64, 'attention_type': object, 'timestamp': np.float64
+        })
         
         # 注意のタイプ別パフォーマンス
         self.attention_performance = {
@@ -220,23 +440,35 @@ class AttentionManager:
             AttentionType.SUSTAINED: 0.8,
             AttentionType.SELECTIVE: 0.9
         }
+        
+        # 統計のキャッシュ（リソース状態・履歴の更新ごとに加算されるバージョンで無効化）
+        self.stats_version = 0
+        self._statistics_version = -1
+        self._statistics: Mapping[str, Any] = MappingProxyType({})
     
-    async def allocate_attention(self, tasks: List[CognitiveTask]) -> Dict[str, float]:
-        """注意リソースの動的配分"""
+    async def allocate_attention(self, tasks: List[CognitiveTask],
+                                 current_time: Optional[datetime] = None) -> Dict[str, float]:
+        """注意リソースの動的配分（current_time省略時は現在時刻）"""
         try:
             allocations = {}
+            if current_time is None:
+                current_time = datetime.now()
             
-            # タスクの優先度計算
-            prioritized_tasks = []
-            for task in tasks:
-                priority = await self._calculate_priority(task)
-                heapq.heappush(prioritized_tasks, (-priority, task))  # 最大ヒープ
+            timestamp = current_time.timestamp()
+            
+            # タスクの優先度計算（全タスク分を一括で算出）
+            priorities = self._calculate_priorities(tasks, timestamp)
+            prioritized_tasks = [
+                (-priority, next(self._heap_counter), task)
+                for priority, task in zip(priorities.tolist(), tasks)
+            ]
+            heapq.heapify(prioritized_tasks)  # 最大ヒープ（全件既知のため一括構築）
             
             # リソース配分
             remaining_attention = self.attention_resource.available
             
             while prioritized_tasks and remaining_attention > 0:
-                neg_priority, task = heapq.heappop(prioritized_tasks)
+                neg_priority, _, task = heapq.heappop(prioritized_tasks)
                 priority = -neg_priority
                 
                 # 必要リソースと利用可能リソースを比較
@@ -255,41 +487,41 @@ class AttentionManager:
                 self.active_tasks[task.task_id] = task
                 
                 # 履歴記録
-                self.attention_history.append({
-                    'task_id': task.task_id,
-                    'allocated': effective_allocation,
-                    'attention_type': attention_type.value,
-                    'timestamp': datetime.now()
-                })
+                self.attention_history.append(task.task_id, effective_allocation, attention_type.value, timestamp)
             
             # リソース状態更新
             self._update_attention_resource(allocations)
             
-            logging.debug(f"🎯 注意配分完了: {len(allocations)}タスクに配分")
+            logging.debug("🎯 注意配分完了: %dタスクに配分", len(allocations))
             return allocations
             
         except Exception as e:
-            logging.error(f"❌ 注意配分エラー: {e}")
+            logging.error("❌ 注意配分エラー: %s", e)
             return {}
     
-    async def _calculate_priority(self, task: CognitiveTask) -> float:
-        """タスク優先度の計算"""
+    def _calculate_priorities(self, tasks: List[CognitiveTask], now_timestamp: float) -> np.ndarray:
+        """タスク優先度の計算（タスク属性を配列化して一括計算）"""
+        count = len(tasks)
+        urgency = np.fromiter((task.urgency for task in tasks), dtype=np.float64, count=count)
+        importance = np.fromiter((task.importance for task in tasks), dtype=np.float64, count=count)
+        emotional_weight = np.fromiter((task.emotional_weight for task in tasks), dtype=np.float64, count=count)
+        complexity = np.fromiter((task.complexity for task in tasks), dtype=np.float64, count=count)
+        deadlines = np.fromiter((task.deadline_timestamp for task in tasks), dtype=np.float64, count=count)
+        
         # アイゼンハワーマトリクス + 感情的重み
-        urgency_importance = task.urgency * task.importance
+        urgency_importance = urgency * importance
         
-        # 締切による緊急度調整
-        deadline_pressure = 0.0
-        if task.deadline:
-            time_to_deadline = (task.deadline - datetime.now()).total_seconds()
-            if time_to_deadline > 0:
-                # 時間が少ないほど優先度UP
-                deadline_pressure = max(0, 1.0 - time_to_deadline / (24 * 3600))  # 1日を基準
+        # 締切による緊急度調整（時間が少ないほど優先度UP、1日を基準、締切超過は0）
+        time_to_deadline = deadlines - now_timestamp
+        deadline_pressure = np.where(
+            time_to_deadline > 0, np.maximum(0.0, 1.0 - time_to_deadline / (24 * 3600)), 0.0
+        )
         
         # 感情的重みの考慮
-        emotional_boost = task.emotional_weight * 0.3
+        emotional_boost = emotional_weight * 0.3
         
         # 複雑性による調整（複雑なタスクは早めに着手）
-        complexity_factor = task.complexity * 0.2
+        complexity_factor = complexity * 0.2
         
         # 総合優先度
         total_priority = (
@@ -299,7 +531,7 @@ class AttentionManager:
             complexity_factor
         )
         
-        return min(total_priority, 1.0)
+        return np.minimum(total_priority, 1.0)
     
     def _determine_attention_type(self, task: CognitiveTask, active_task_count: int) -> AttentionType:
         """注意タイプの決定"""
@@ -314,6 +546,7 @@ class AttentionManager:
     
     def _update_attention_resource(self, allocations: Dict[str, float]):
         """注意リソース状態の更新"""
+        self.stats_version += 1
         total_allocated = sum(allocations.values())
         self.attention_resource.allocated = total_allocated
         self.attention_resource.available = self.attention_resource.total_capacity - total_allocated
@@ -335,14 +568,19 @@ class AttentionManager:
             released_amount = task.required_attention
             
             del self.active_tasks[task_id]
+            self.stats_version += 1
             self.attention_resource.available += released_amount
             self.attention_resource.allocated -= released_amount
             
-            logging.debug(f"🔓 注意解放: {task_id} -> {released_amount}リソース")
+            logging.debug("🔓 注意解放: %s -> %sリソース", task_id, released_amount)
     
-    def get_attention_statistics(self) -> Dict[str, Any]:
-        """注意管理統計"""
-        return {
+    def get_attention_statistics(self) -> Mapping[str, Any]:
+        """注意管理統計（読み取り専用、状態の更新がなければキャッシュを返す）"""
+        if self._statistics_version == self.stats_version:
+            return self._statistics
+        
+        self._statistics_version = self.stats_version
+        self._statistics = MappingProxyType({
             'total_capacity': self.attention_resource.total_capacity,
             'allocated': self.attention_resource.allocated,
             'available': self.attention_resource.available,
@@ -350,7 +588,8 @@ class AttentionManager:
             'fatigue_level': self.attention_resource.fatigue_level,
             'active_tasks': len(self.active_tasks),
             'attention_history_size': len(self.attention_history)
-        }
+        })
+        return self._statistics
 
 class ConflictResolver:
     """競合解決システム"""
@@ -363,7 +602,10 @@ class ConflictResolver:
             'strategy_conflict': self._resolve_strategy_conflict
         }
         
-        self.conflict_history = deque(maxlen=500)
+        # 競合解決の履歴（列指向、timestampはエポック秒）
+        self.conflict_history = _ColumnarHistory(500, {
+            'conflict_type': object, 'options_count': np.int32, 'resolution': object, 'timestamp': np.float64
+        })
         
     async def resolve_conflict(self, conflicting_options: List[Dict[str, Any]], 
                              context: Dict[str, Any]) -> Dict[str, Any]:
@@ -380,19 +622,13 @@ class ConflictResolver:
             resolved_decision = await resolution_strategy(conflicting_options, context)
             
             # 競合履歴に記録
-            conflict_record = {
-                'conflict_type': conflict_type,
-                'options_count': len(conflicting_options),
-                'resolution': resolved_decision,
-                'timestamp': datetime.now()
-            }
-            self.conflict_history.append(conflict_record)
+            self.conflict_history.append(conflict_type, len(conflicting_options), resolved_decision, time.time())
             
-            logging.info(f"⚖️ 競合解決: {conflict_type} -> {resolved_decision.get('strategy', 'unknown')}")
+            logging.info("⚖️ 競合解決: %s -> %s", conflict_type, resolved_decision.get('strategy', 'unknown'))
             return resolved_decision
             
         except Exception as e:
-            logging.error(f"❌ 競合解決エラー: {e}")
+            logging.error("❌ 競合解決エラー: %s", e)
             # フォールバック: 最初のオプションを選択
             return conflicting_options[0] if conflicting_options else {}
     
@@ -428,37 +664,29 @@ class ConflictResolver:
     async def _resolve_resource_conflict(self, options: List[Dict[str, Any]], 
                                        context: Dict[str, Any]) -> Dict[str, Any]:
         """リソース競合の解決"""
-        # 効率性でソート
-        efficiency_sorted = sorted(
-            options, 
-            key=lambda x: x.get('expected_value', 0) / max(x.get('required_resources', 1), 1),
-            reverse=True
+        # 効率性が最大のもの（同点は先頭）
+        return max(
+            options,
+            key=lambda x: x.get('expected_value', 0) / max(x.get('required_resources', 1), 1)
         )
-        return efficiency_sorted[0]
     
     async def _resolve_priority_conflict(self, options: List[Dict[str, Any]], 
                                        context: Dict[str, Any]) -> Dict[str, Any]:
         """優先度競合の解決"""
         # セカンダリ基準（感情的重み、複雑性など）で判定
-        secondary_sorted = sorted(
+        return max(
             options,
             key=lambda x: (
                 x.get('emotional_weight', 0) * 0.4 +
                 x.get('urgency', 0) * 0.6
-            ),
-            reverse=True
+            )
         )
-        return secondary_sorted[0]
     
     async def _resolve_temporal_conflict(self, options: List[Dict[str, Any]], 
                                        context: Dict[str, Any]) -> Dict[str, Any]:
         """時間的競合の解決"""
         # 締切が最も近いものを優先
-        deadline_sorted = sorted(
-            options,
-            key=lambda x: x.get('deadline', datetime.max)
-        )
-        return deadline_sorted[0]
+        return min(options, key=lambda x: x.get('deadline', datetime.max))
     
     async def _resolve_strategy_conflict(self, options: List[Dict[str, Any]], 
                                        context: Dict[str, Any]) -> Dict[str, Any]:
@@ -482,25 +710,15 @@ class ConflictResolver:
     async def _resolve_generic_conflict(self, options: List[Dict[str, Any]], 
                                       context: Dict[str, Any]) -> Dict[str, Any]:
         """汎用的競合解決"""
-        # 多基準意思決定分析（MCDA）
-        weights = {
-            'priority': 0.3,
-            'expected_value': 0.25,
-            'confidence': 0.2,
-            'emotional_weight': 0.15,
-            'efficiency': 0.1
-        }
-        
-        scored_options = []
-        for option in options:
-            score = sum(
-                option.get(criterion, 0) * weight
-                for criterion, weight in weights.items()
-            )
-            scored_options.append((score, option))
+        # 多基準意思決定分析（MCDA）: 選択肢×基準の行列と重みベクトルの積
+        criteria_values = np.fromiter(
+            (option.get(criterion, 0) for option in options for criterion in _MCDA_CRITERIA),
+            dtype=np.float64, count=len(options) * len(_MCDA_CRITERIA)
+        ).reshape(-1, len(_MCDA_CRITERIA))
+        scores = criteria_values @ _MCDA_WEIGHTS
         
-        scored_options.sort(reverse=True)
-        return scored_options[0][1]
+        # スコア最大のもの（同点は先頭）
+        return options[int(scores.argmax())]
 
 class MetaCognitiveMonitor:
     """メタ認知監視システム"""
@@ -521,15 +739,27 @@ class MetaCognitiveMonitor:
         }
         
         self.monitoring_history = deque(maxlen=1000)
+        
+        # 統計のキャッシュ（監視状態・信念の更新ごとに加算されるバージョンで無効化）
+        self.stats_version = 0
+        self._statistics_version = -1
+        self._statistics: Mapping[str, Any] = MappingProxyType({})
+        
+        # 単一の監視タスクが、キュー経由で受け取った全ての監視コンテキストを1秒ごとに巡回
+        self._monitoring_queue: Optional[asyncio.Queue] = None
+        self._monitoring_wakeup: Optional[asyncio.Event] = None  # 監視停止時に巡回待ちを即座に解除
+        self._monitoring_task: Optional[asyncio.Task] = None
+        self._active_contexts: List[Dict[str, Any]] = []
     
     async def start_monitoring(self, decision: ExecutiveDecision):
         """メタ認知監視の開始"""
         try:
             self.monitoring_active = True
+            self.stats_version += 1
             
             monitoring_context = {
                 'decision_id': decision.decision_id,
-                'strategy': decision.chosen_strategy.value,
+                'strategy': decision.chosen_strategy.label,
                 'confidence': decision.confidence,
                 'start_time': datetime.now(),
                 'expected_difficulty': self._estimate_task_difficulty(decision)
@@ -537,53 +767,81 @@ class MetaCognitiveMonitor:
             
             self.monitoring_history.append(monitoring_context)
             
-            # バックグラウンドで監視を開始
-            monitoring_task = asyncio.create_task(
-                self._continuous_monitoring(monitoring_context)
-            )
+            # 監視タスクが未起動（または停止済み）なら起動し、コンテキストを投入
+            if self._monitoring_task is None or self._monitoring_task.done():
+                self._monitoring_queue = asyncio.Queue()
+                self._monitoring_wakeup = asyncio.Event()
+                self._active_contexts = []
+                self._monitoring_task = asyncio.create_task(self._continuous_monitoring())
+            self._monitoring_queue.put_nowait(monitoring_context)
             
-            logging.debug(f"🔍 メタ認知監視開始: {decision.decision_id}")
-            return monitoring_task
+            logging.debug("🔍 メタ認知監視開始: %s", decision.decision_id)
+            return self._monitoring_task
             
         except Exception as e:
-            logging.error(f"❌ メタ認知監視開始エラー: {e}")
+            logging.error("❌ メタ認知監視開始エラー: %s", e)
             return None
     
-    async def _continuous_monitoring(self, context: Dict[str, Any]):
-        """継続的な監視プロセス"""
+    async def _continuous_monitoring(self):
+        """継続的な監視プロセス（全ての監視コンテキストを単一タスクで巡回）"""
+        queue = self._monitoring_queue
+        wakeup = self._monitoring_wakeup
+        active_contexts = self._active_contexts
         try:
-            start_time = context['start_time']
-            
-            while self.monitoring_active:
-                current_time = datetime.now()
-                elapsed_time = (current_time - start_time).total_seconds()
-                
-                # パフォーマンス評価
-                performance_assessment = await self._assess_current_performance(context)
+            while True:
+                # 監視対象がなければ次のコンテキストが投入されるまで待機
+                if not active_contexts:
+                    active_contexts.append(await queue.get())
+                while not queue.empty():
+                    active_contexts.append(queue.get_nowait())
                 
-                # 必要に応じて介入
-                if performance_assessment['needs_intervention']:
-                    await self._metacognitive_intervention(context, performance_assessment)
+                expired_contexts = []
+                current_time = datetime.now()  # 1回の巡回で共通の時刻
+                for context in active_contexts:
+                    try:
+                        elapsed_time = (current_time - context['start_time']).total_seconds()
+                        
+                        # パフォーマンス評価
+                        performance_assessment = await self._assess_current_performance(context, current_time)
+                        
+                        # 必要に応じて介入
+                        if performance_assessment['needs_intervention']:
+                            await self._metacognitive_intervention(context, performance_assessment)
+                        
+                        # 信念の更新
+                        self._update_metacognitive_beliefs(context, performance_assessment)
+                        
+                        # 最大監視時間（5分）
+                        if elapsed_time > 300:
+                            expired_contexts.append(context)
+                            
+                    except Exception as e:
+                        logging.error("❌ メタ認知監視エラー: %s", e)
+                        expired_contexts.append(context)
                 
-                # 信念の更新
-                self._update_metacognitive_beliefs(context, performance_assessment)
+                # 1秒間隔で監視（監視停止の通知があれば待たずに再開）
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
                 
-                # 1秒間隔で監視
-                await asyncio.sleep(1.0)
-                
-                # 最大監視時間（5分）
-                if elapsed_time > 300:
-                    break
+                if not self.monitoring_active:
+                    # 監視停止時は進行中の全コンテキストを終了
+                    active_contexts.clear()
+                elif expired_contexts:
+                    expired_ids = set(map(id, expired_contexts))
+                    active_contexts[:] = [context for context in active_contexts if id(context) not in expired_ids]
                     
         except asyncio.CancelledError:
             logging.debug("🔍 メタ認知監視が停止されました")
-        except Exception as e:
-            logging.error(f"❌ メタ認知監視エラー: {e}")
     
-    async def _assess_current_performance(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """現在のパフォーマンス評価"""
+    async def _assess_current_performance(self, context: Dict[str, Any],
+                                          current_time: Optional[datetime] = None) -> Dict[str, Any]:
+        """現在のパフォーマンス評価（current_time省略時は現在時刻）"""
         try:
-            current_time = datetime.now()
+            if current_time is None:
+                current_time = datetime.now()
             elapsed_time = (current_time - context['start_time']).total_seconds()
             
             # 進捗評価
@@ -607,7 +865,7 @@ class MetaCognitiveMonitor:
             }
             
         except Exception as e:
-            logging.error(f"❌ パフォーマンス評価エラー: {e}")
+            logging.error("❌ パフォーマンス評価エラー: %s", e)
             return {'needs_intervention': False}
     
     async def _metacognitive_intervention(self, context: Dict[str, Any], 
@@ -619,12 +877,12 @@ class MetaCognitiveMonitor:
             if assessment['progress_deviation'] > 0.3:
                 intervention_type = "progress_adjustment"
                 # 進捗調整の提案
-                logging.warning(f"🚨 進捗遅延検出: {context['decision_id']}")
+                logging.warning("🚨 進捗遅延検出: %s", context['decision_id'])
                 
             elif assessment.get('confidence_drift', 0) < -0.2:
                 intervention_type = "confidence_restoration"
                 # 信頼度回復の提案
-                logging.warning(f"🚨 信頼度低下検出: {context['decision_id']}")
+                logging.warning("🚨 信頼度低下検出: %s", context['decision_id'])
             
             # 介入履歴に記録
             intervention_record = {
@@ -635,24 +893,16 @@ class MetaCognitiveMonitor:
             }
             
             # 実際の介入は他のシステムコンポーネントに委譲
-            logging.info(f"🔧 メタ認知介入: {intervention_type}")
+            logging.info("🔧 メタ認知介入: %s", intervention_type)
             
         except Exception as e:
-            logging.error(f"❌ メタ認知介入エラー: {e}")
+            logging.error("❌ メタ認知介入エラー: %s", e)
     
     def _estimate_task_difficulty(self, decision: ExecutiveDecision) -> float:
         """タスク難易度の推定"""
         # 戦略の複雑性、タスク数、リソース要求などから推定
         base_difficulty = len(decision.task_sequence) / 10.0
-        strategy_complexity = {
-            DecisionStrategy.RATIONAL: 0.3,
-            DecisionStrategy.INTUITIVE: 0.1,
-            DecisionStrategy.HYBRID: 0.5,
-            DecisionStrategy.EMOTIONAL: 0.2,
-            DecisionStrategy.CONSERVATIVE: 0.4
-        }
-        
-        strategy_factor = strategy_complexity.get(decision.chosen_strategy, 0.3)
+        strategy_factor = _STRATEGY_COMPLEXITY[decision.chosen_strategy]
         confidence_factor = 1.0 - decision.confidence
         
         estimated_difficulty = min(base_difficulty + strategy_factor + confidence_factor, 1.0)
@@ -661,13 +911,18 @@ class MetaCognitiveMonitor:
     def _update_metacognitive_beliefs(self, context: Dict[str, Any], 
                                     assessment: Dict[str, Any]):
         """メタ認知的信念の更新"""
+        self.stats_version += 1
         strategy = context['strategy']
         
         # 戦略効果性の更新
         if not assessment['needs_intervention']:
-            self.metacognitive_beliefs['strategy_effectiveness'][strategy] += 0.1
+            effectiveness = self.metacognitive_beliefs['strategy_effectiveness'][strategy] + 0.1
         else:
-            self.metacognitive_beliefs['strategy_effectiveness'][strategy] -= 0.05
+            effectiveness = self.metacognitive_beliefs['strategy_effectiveness'][strategy] - 0.05
+        # 監視の巡回ごとに加減算されるため-1〜1に制限
+        self.metacognitive_beliefs['strategy_effectiveness'][strategy] = (
+            -1.0 if effectiveness < -1.0 else (1.0 if effectiveness > 1.0 else effectiveness)
+        )
         
         # 信頼度校正の更新
         confidence_error = abs(context['confidence'] - assessment.get('actual_performance', 0.5))
@@ -677,10 +932,17 @@ class MetaCognitiveMonitor:
     def stop_monitoring(self):
         """監視の停止"""
         self.monitoring_active = False
+        self.stats_version += 1
+        if self._monitoring_wakeup is not None:
+            self._monitoring_wakeup.set()
     
-    def get_metacognitive_statistics(self) -> Dict[str, Any]:
-        """メタ認知統計"""
-        return {
+    def get_metacognitive_statistics(self) -> Mapping[str, Any]:
+        """メタ認知統計（読み取り専用、監視状態・信念の更新がなければキャッシュを返す）"""
+        if self._statistics_version == self.stats_version:
+            return self._statistics
+        
+        self._statistics_version = self.stats_version
+        self._statistics = MappingProxyType({
             'monitoring_active': self.monitoring_active,
             'confidence_calibration': self.metacognitive_beliefs['confidence_calibration'],
             'strategy_effectiveness': dict(self.metacognitive_beliefs['strategy_effectiveness']),
@@ -688,7 +950,8 @@ class MetaCognitiveMonitor:
             'performance_metrics': {
                 metric: len(values) for metric, values in self.performance_metrics.items()
             }
-        }
+        })
+        return self._statistics
 
 class ExecutiveController:
     """高次認知制御システム統合"""
@@ -699,84 +962,150 @@ class ExecutiveController:
         self.conflict_resolver = ConflictResolver()
         self.meta_cognition = MetaCognitiveMonitor()
         
-        # 意思決定履歴
-        self.decision_history = deque(maxlen=1000)
+        # 意思決定履歴（decision_idからの索引を併せて保持）
+        self.max_decision_history = 1000
+        self.decision_history = deque(maxlen=self.max_decision_history)
+        self._decision_index: Dict[str, ExecutiveDecision] = {}
+        
+        # 決定IDの連番（時刻の文字列化に頼らず一意性を保証）
+        self._decision_id_counter = itertools.count()
+        
+        # 学習パラメータ（戦略別の直近スコアのリングバッファと、その合計の逐次更新値、いずれも戦略で索引）
+        self.max_strategy_samples = 200
+        self.strategy_performance: List[deque] = [
+            deque(maxlen=self.max_strategy_samples) for _ in DecisionStrategy
+        ]
+        self._strategy_performance_sums: List[float] = [0.0] * len(DecisionStrategy)
+        self._strategy_recent_performance: List[deque] = [deque(maxlen=5) for _ in DecisionStrategy]
         
-        # 学習パラメータ
-        self.strategy_performance = defaultdict(list)
+        # 分析・競合解決結果のLRUキャッシュ（同一タスク群・同一条件の再評価を省略）
+        self._decision_cache: OrderedDict = OrderedDict()
+        self.max_decision_cache_size = 256
+        self.decision_cache_hits = 0
+        self.decision_cache_misses = 0
         
     async def executive_decision(self, task_options: List[CognitiveTask], 
                                context: Dict[str, Any]) -> ExecutiveDecision:
         """高次の実行決定プロセス"""
         try:
+            # 決定全体で共通の時刻（所要時間の計測は単調時計）
             decision_start_time = datetime.now()
+            decision_start_counter = time.perf_counter()
             
             # 1. 作業記憶への情報ロード
             for task in task_options:
-                self.working_memory.add_item(task, "episodic")
+                self.working_memory.add_item(task, "episodic", decision_start_time)
             
             # 2. 注意リソースの評価
-            attention_allocations = await self.attention_manager.allocate_attention(task_options)
-            
-            # 3. 複数評価軸での分析
-            evaluations = await asyncio.gather(
-                self._rational_analysis(task_options, context),
-                self._intuitive_analysis(task_options, context),
-                self._emotional_analysis(task_options, context)
+            attention_allocations = await self.attention_manager.allocate_attention(
+                task_options, decision_start_time
             )
             
-            # 4. 競合検出と解決
-            if self._detect_evaluation_conflicts(evaluations):
-                resolved_evaluation = await self.conflict_resolver.resolve_conflict(
-                    evaluations, context
-                )
+            # 3-4. 複数評価軸での分析と競合解決（同一条件ならキャッシュを再利用）
+            cache_key = self._decision_cache_key(task_options, context)
+            resolved_evaluation = self._decision_cache.get(cache_key)
+            if resolved_evaluation is not None:
+                self._decision_cache.move_to_end(cache_key)
+                self.decision_cache_hits += 1
             else:
-                resolved_evaluation = self._integrate_evaluations(evaluations)
+                self.decision_cache_misses += 1
+                
+                # 3. 複数評価軸での分析（いずれも純粋な計算のため同期的に順次実行、属性配列は共有）
+                task_arrays = self._prepare_task_arrays(task_options)
+                evaluations = [
+                    self._rational_analysis(task_options, context, task_arrays),
+                    self._intuitive_analysis(task_options, context, task_arrays),
+                    self._emotional_analysis(task_options, context, task_arrays)
+                ]
+                
+                # 4. 競合検出と解決（競合がなければ統合結果をそのまま採用）
+                has_conflict, resolved_evaluation = self._reduce_evaluations(evaluations)
+                if has_conflict:
+                    resolved_evaluation = await self.conflict_resolver.resolve_conflict(
+                        evaluations, context
+                    )
+                
+                self._decision_cache[cache_key] = resolved_evaluation
+                if len(self._decision_cache) > self.max_decision_cache_size:
+                    self._decision_cache.popitem(last=False)
             
             # 5. 最終決定の形成
             executive_decision = self._form_executive_decision(
-                resolved_evaluation, attention_allocations, context
+                resolved_evaluation, attention_allocations, context, decision_start_time
             )
             
             # 6. メタ認知監視の開始
             monitoring_task = await self.meta_cognition.start_monitoring(executive_decision)
             
             # 7. 決定履歴への記録
-            self.decision_history.append(executive_decision)
+            self._append_decision(executive_decision)
             
-            execution_time = (datetime.now() - decision_start_time).total_seconds()
-            logging.info(f"🧠 実行決定完了: {executive_decision.decision_id} "
-                        f"({execution_time:.2f}秒, 戦略: {executive_decision.chosen_strategy.value})")
+            execution_time = time.perf_counter() - decision_start_counter
+            logging.info("🧠 実行決定完了: %s (%.2f秒, 戦略: %s)",
+                         executive_decision.decision_id, execution_time, executive_decision.chosen_strategy.label)
             
             return executive_decision
             
         except Exception as e:
-            logging.error(f"❌ 実行決定エラー: {e}")
+            logging.error("❌ 実行決定エラー: %s", e)
             # フォールバック決定
             return self._create_fallback_decision(task_options)
     
-    async def _rational_analysis(self, tasks: List[CognitiveTask], 
-                               context: Dict[str, Any]) -> Dict[str, Any]:
-        """合理的分析"""
+    def _decision_cache_key(self, tasks: List[CognitiveTask], context: Dict[str, Any]) -> bytes:
+        """意思決定キャッシュのキー（分析・競合解決が参照する値のみをblake2bで16バイトに要約、順序も保持）"""
+        system_state = context.get('system_state', {})
+        signature = hashlib.blake2b(digest_size=16)
+        for task in tasks:
+            task_id = task.task_id.encode()
+            task_type = task.task_type.encode()
+            # 可変長の文字列は長さを前置して境界を曖昧にしない
+            signature.update(_TASK_SIGNATURE_HEADER.pack(len(task_id), len(task_type)))
+            signature.update(task_id)
+            signature.update(task_type)
+            signature.update(_TASK_SIGNATURE_FIELDS.pack(*_task_numeric_fields(task)))
+        signature.update(repr((
+            len(tasks),
+            context.get('available_resources', 100),
+            system_state.get('stress_level', 0) > 0.7
+        )).encode())
+        return signature.digest()
+    
+    def _prepare_task_arrays(self, tasks: List[CognitiveTask]) -> TaskArrays:
+        """分析用にタスク属性を列ごとの配列に展開（全分析で共有）"""
+        count = len(tasks)
+        
+        # 数値属性は1パスで(タスク数, 5)の行列にまとめ、各列をビューとして渡す
+        urgency, importance, complexity, required_attention, emotional_weight = np.array(
+            [_task_numeric_fields(task) for task in tasks], dtype=np.float64
+        ).reshape(count, 5).T
+        task_types = [task.task_type for task in tasks]
+        
+        return TaskArrays(
+            importance=importance,
+            complexity=complexity,
+            required_attention=required_attention,
+            urgency=urgency,
+            emotional_weight=emotional_weight,
+            is_typical=np.fromiter((task_type in ('simple', 'qa') for task_type in task_types), dtype=bool, count=count),
+            is_creative=np.fromiter((task_type == 'creative' for task_type in task_types), dtype=bool, count=count)
+        )
+    
+    def _rational_analysis(self, tasks: List[CognitiveTask], 
+                         context: Dict[str, Any],
+                         arrays: Optional[TaskArrays] = None) -> Dict[str, Any]:
+        """合理的分析（arrays省略時はtasksから生成）"""
         try:
-            # 期待値理論に基づく分析
-            task_scores = []
-            
-            for task in tasks:
-                # 利益 × 成功確率 - コスト × 失敗確率
-                estimated_success_prob = 1.0 - task.complexity * 0.3
-                expected_benefit = task.importance * estimated_success_prob
-                estimated_cost = task.required_attention / 100.0
-                
-                utility_score = expected_benefit - estimated_cost
-                task_scores.append((utility_score, task))
+            # 期待値理論に基づく分析（タスク属性の配列で一括計算）
+            if arrays is None:
+                arrays = self._prepare_task_arrays(tasks)
+            utility_scores = _expected_utilities(arrays.importance, arrays.complexity, arrays.required_attention)
             
             # 最高スコアのタスクを選択
-            task_scores.sort(reverse=True)
+            task_scores = _top_scored(utility_scores, tasks)
             best_task = task_scores[0][1] if task_scores else tasks[0]
             
             return {
-                'strategy': DecisionStrategy.RATIONAL,
+                'strategy': _RATIONAL,
                 'recommended_task': best_task,
                 'confidence': 0.8,
                 'rationale': 'Expected utility maximization',
@@ -784,34 +1113,24 @@ class ExecutiveController:
             }
             
         except Exception as e:
-            logging.error(f"❌ 合理的分析エラー: {e}")
-            return {'strategy': DecisionStrategy.RATIONAL, 'confidence': 0.1}
+            logging.error("❌ 合理的分析エラー: %s", e)
+            return _failed_evaluation(_RATIONAL)
     
-    async def _intuitive_analysis(self, tasks: List[CognitiveTask], 
-                                context: Dict[str, Any]) -> Dict[str, Any]:
-        """直感的分析"""
+    def _intuitive_analysis(self, tasks: List[CognitiveTask], 
+                          context: Dict[str, Any],
+                          arrays: Optional[TaskArrays] = None) -> Dict[str, Any]:
+        """直感的分析（arrays省略時はtasksから生成）"""
         try:
-            # ヒューリスティックベースの判断
-            intuitive_scores = []
-            
-            for task in tasks:
-                # 認識しやすさ（availability heuristic）
-                familiarity = 1.0 - task.complexity
-                
-                # 代表性（representativeness heuristic）
-                typical_pattern = 0.7 if task.task_type in ['simple', 'qa'] else 0.5
-                
-                # アンカリング効果
-                anchor_adjustment = task.urgency * 0.8
-                
-                intuitive_score = (familiarity + typical_pattern + anchor_adjustment) / 3.0
-                intuitive_scores.append((intuitive_score, task))
-            
-            intuitive_scores.sort(reverse=True)
+            # ヒューリスティックベースの判断（タスク属性を配列化して一括計算）
+            if arrays is None:
+                arrays = self._prepare_task_arrays(tasks)
+            intuitive_scores = _top_scored(
+                _intuitive_scores(arrays.complexity, arrays.urgency, arrays.is_typical), tasks
+            )
             best_task = intuitive_scores[0][1] if intuitive_scores else tasks[0]
             
             return {
-                'strategy': DecisionStrategy.INTUITIVE,
+                'strategy': _INTUITIVE,
                 'recommended_task': best_task,
                 'confidence': 0.6,
                 'rationale': 'Heuristic-based fast judgment',
@@ -819,33 +1138,25 @@ class ExecutiveController:
             }
             
         except Exception as e:
-            logging.error(f"❌ 直感的分析エラー: {e}")
-            return {'strategy': DecisionStrategy.INTUITIVE, 'confidence': 0.1}
+            logging.error("❌ 直感的分析エラー: %s", e)
+            return _failed_evaluation(_INTUITIVE)
     
-    async def _emotional_analysis(self, tasks: List[CognitiveTask], 
-                                context: Dict[str, Any]) -> Dict[str, Any]:
-        """感情的分析"""
+    def _emotional_analysis(self, tasks: List[CognitiveTask], 
+                          context: Dict[str, Any],
+                          arrays: Optional[TaskArrays] = None) -> Dict[str, Any]:
+        """感情的分析（arrays省略時はtasksから生成）"""
         try:
-            emotional_scores = []
-            
-            for task in tasks:
-                # 感情的重みに基づく評価
-                emotional_appeal = task.emotional_weight
-                
-                # ストレス軽減効果
-                stress_relief = 1.0 - task.complexity if task.task_type == 'creative' else 0.3
-                
-                # 達成感の予測
-                achievement_feeling = task.importance * 0.8
-                
-                emotional_score = (emotional_appeal + stress_relief + achievement_feeling) / 3.0
-                emotional_scores.append((emotional_score, task))
-            
-            emotional_scores.sort(reverse=True)
+            # 感情的重み・ストレス軽減効果・達成感の予測に基づく評価
+            if arrays is None:
+                arrays = self._prepare_task_arrays(tasks)
+            emotional_scores = _top_scored(
+                _emotional_scores(arrays.emotional_weight, arrays.complexity,
+                                  arrays.importance, arrays.is_creative), tasks
+            )
             best_task = emotional_scores[0][1] if emotional_scores else tasks[0]
             
             return {
-                'strategy': DecisionStrategy.EMOTIONAL,
+                'strategy': _EMOTIONAL,
                 'recommended_task': best_task,
                 'confidence': 0.7,
                 'rationale': 'Emotion-driven selection',
@@ -853,64 +1164,91 @@ class ExecutiveController:
             }
             
         except Exception as e:
-            logging.error(f"❌ 感情的分析エラー: {e}")
-            return {'strategy': DecisionStrategy.EMOTIONAL, 'confidence': 0.1}
-    
-    def _detect_evaluation_conflicts(self, evaluations: List[Dict[str, Any]]) -> bool:
-        """評価間の競合検出"""
-        recommended_tasks = [
-            eval_result.get('recommended_task') 
-            for eval_result in evaluations 
-            if eval_result.get('recommended_task')
-        ]
-        
-        # 異なるタスクが推奨されている場合は競合
-        unique_recommendations = set(
-            task.task_id for task in recommended_tasks if task
-        )
-        
-        return len(unique_recommendations) > 1
+            logging.error("❌ 感情的分析エラー: %s", e)
+            return _failed_evaluation(_EMOTIONAL)
     
-    def _integrate_evaluations(self, evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """評価の統合"""
-        # 信頼度による重み付け平均
-        total_confidence = sum(eval_result.get('confidence', 0) for eval_result in evaluations)
+    def _reduce_evaluations(self, evaluations: List[Dict[str, Any]]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """評価間の競合検出と統合を1パスで行う（競合時は(True, None)、それ以外は(False, 統合結果)）"""
+        first_task_id = None
+        total_confidence = 0
+        best_evaluation = None
+        best_confidence = -math.inf
+        for eval_result in evaluations:
+            # 異なるタスクが推奨されている場合は競合（統合は不要なので打ち切る）
+            task = eval_result.get('recommended_task')
+            if task:
+                if first_task_id is None:
+                    first_task_id = task.task_id
+                elif task.task_id != first_task_id:
+                    return True, None
+            
+            # 信頼度の合計と最も信頼度の高い評価
+            confidence = eval_result.get('confidence', 0)
+            total_confidence += confidence
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_evaluation = eval_result
         
-        if total_confidence == 0:
-            return evaluations[0]  # フォールバック
+        if total_confidence == 0 or best_evaluation is None:
+            return False, evaluations[0]  # フォールバック
         
-        # 最も信頼度の高い評価を採用
-        best_evaluation = max(evaluations, key=lambda x: x.get('confidence', 0))
-        best_evaluation['strategy'] = DecisionStrategy.HYBRID
+        # 最も信頼度の高い評価を採用（元の評価結果は変更しない）
+        best_evaluation = dict(best_evaluation)
+        best_evaluation['strategy'] = _HYBRID
         best_evaluation['rationale'] = 'Integrated multi-perspective analysis'
         
-        return best_evaluation
+        return False, best_evaluation
     
     def _form_executive_decision(self, evaluation: Dict[str, Any], 
                                attention_allocations: Dict[str, float], 
-                               context: Dict[str, Any]) -> ExecutiveDecision:
-        """実行決定の形成"""
-        decision_id = f"exec_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+                               context: Dict[str, Any],
+                               current_time: Optional[datetime] = None) -> ExecutiveDecision:
+        """実行決定の形成（current_time省略時は現在時刻）"""
+        # 分析・統合結果は全キーを持つため直接参照し、欠けている場合のみ既定値で補完
+        try:
+            strategy = evaluation['strategy']
+            recommended_task = evaluation['recommended_task']
+            confidence = evaluation['confidence']
+            rationale = evaluation['rationale']
+            evaluation_details = evaluation['evaluation_details']
+        except KeyError:
+            return self._form_executive_decision(
+                {**_EVALUATION_DEFAULTS, **evaluation}, attention_allocations, context, current_time
+            )
+        
+        if current_time is None:
+            current_time = datetime.now()
+        decision_id = f"exec_{next(self._decision_id_counter):08x}"
         
-        recommended_task = evaluation.get('recommended_task')
         task_sequence = [recommended_task.task_id] if recommended_task else []
         
         decision = ExecutiveDecision(
             decision_id=decision_id,
-            chosen_strategy=evaluation.get('strategy', DecisionStrategy.RATIONAL),
+            chosen_strategy=strategy,
             task_sequence=task_sequence,
             resource_allocation=attention_allocations,
-            confidence=evaluation.get('confidence', 0.5),
-            rationale=evaluation.get('rationale', 'Default decision'),
-            alternatives_considered=evaluation.get('evaluation_details', []),
-            timestamp=datetime.now()
+            confidence=confidence,
+            rationale=rationale,
+            alternatives_considered=list(evaluation_details),
+            timestamp=current_time
         )
         
         return decision
     
+    def _append_decision(self, decision: ExecutiveDecision):
+        """決定履歴への追加（押し出される最古の決定は索引からも除外）"""
+        history = self.decision_history
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            if self._decision_index.get(evicted.decision_id) is evicted:
+                del self._decision_index[evicted.decision_id]
+        history.append(decision)
+        self._decision_index[decision.decision_id] = decision
+    
     def _create_fallback_decision(self, tasks: List[CognitiveTask]) -> ExecutiveDecision:
         """フォールバック決定の作成"""
-        decision_id = f"fallback_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        current_time = datetime.now()
+        decision_id = f"fallback_{next(self._decision_id_counter):08x}"
         
         # 最初のタスクを選択
         first_task = tasks[0] if tasks else None
@@ -918,13 +1256,13 @@ class ExecutiveController:
         
         return ExecutiveDecision(
             decision_id=decision_id,
-            chosen_strategy=DecisionStrategy.CONSERVATIVE,
+            chosen_strategy=_CONSERVATIVE,
             task_sequence=task_sequence,
             resource_allocation={},
             confidence=0.3,
             rationale='Fallback decision due to error',
             alternatives_considered=[],
-            timestamp=datetime.now()
+            timestamp=current_time
         )
     
     async def update_strategy_performance(self, decision_id: str, success: bool, 
@@ -932,11 +1270,7 @@ class ExecutiveController:
         """戦略パフォーマンスの更新"""
         try:
             # 決定履歴から該当決定を検索
-            target_decision = None
-            for decision in reversed(self.decision_history):
-                if decision.decision_id == decision_id:
-                    target_decision = decision
-                    break
+            target_decision = self._decision_index.get(decision_id)
             
             if target_decision:
                 strategy = target_decision.chosen_strategy
@@ -951,22 +1285,28 @@ class ExecutiveController:
                     )
                     performance_score = (performance_score + weighted_score) / 2.0
                 
-                self.strategy_performance[strategy].append(performance_score)
+                performances = self.strategy_performance[strategy]
+                if len(performances) == performances.maxlen:
+                    # 押し出される最古のスコアを合計から除外
+                    self._strategy_performance_sums[strategy] -= performances[0]
+                performances.append(performance_score)
+                self._strategy_performance_sums[strategy] += performance_score
+                self._strategy_recent_performance[strategy].append(performance_score)
                 
-                logging.debug(f"📊 戦略パフォーマンス更新: {strategy.value} -> {performance_score:.2f}")
+                logging.debug("📊 戦略パフォーマンス更新: %s -> %.2f", strategy.label, performance_score)
             
         except Exception as e:
-            logging.error(f"❌ 戦略パフォーマンス更新エラー: {e}")
+            logging.error("❌ 戦略パフォーマンス更新エラー: %s", e)
     
     def get_executive_statistics(self) -> Dict[str, Any]:
         """実行制御統計"""
         strategy_stats = {}
-        for strategy, performances in self.strategy_performance.items():
+        for strategy, performances in zip(DecisionStrategy, self.strategy_performance):
             if performances:
-                strategy_stats[strategy.value] = {
-                    'average_performance': sum(performances) / len(performances),
+                strategy_stats[strategy.label] = {
+                    'average_performance': self._strategy_performance_sums[strategy] / len(performances),
                     'sample_count': len(performances),
-                    'recent_performance': performances[-5:] if len(performances) >= 5 else performances
+                    'recent_performance': list(self._strategy_recent_performance[strategy])
                 }
         
         return {
@@ -974,5 +1314,10 @@ class ExecutiveController:
             'attention_manager': self.attention_manager.get_attention_statistics(),
             'metacognition': self.meta_cognition.get_metacognitive_statistics(),
             'decision_history_size': len(self.decision_history),
+            'decision_cache': {
+                'size': len(self._decision_cache),
+                'hits': self.decision_cache_hits,
+                'misses': self.decision_cache_misses
+            },
             'strategy_performance': strategy_stats
         }
\ No newline at end of file
@@ -4,17 +4,20 @@ Integrated Neural System - 脳型統合処理システム
 """
 
 import asyncio
+import heapq
 import logging
 import json
 import math
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import time
+from typing import Awaitable, Dict, Any, List, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from collections import defaultdict, deque
 
 from .neural_kernel import NeuralKernel, SystemStatus
-from .emotional_system import EmotionalProcessingSystem, EmotionalContext, ThreatLevel
+from .emotional_system import EmotionalProcessingSystem, EmotionalContext, ThreatLevel, EmotionalState
 from .executive_controller import ExecutiveController, CognitiveTask, ExecutiveDecision, DecisionStrategy
 
 class ProcessingMode(Enum):
@@ -65,6 +68,18 @@ class FeedbackLoop:
     last_update: datetime
     active: bool
     performance_impact: float
+    last_update_mono: float = field(default_factory=time.monotonic)  # 更新判定用の単調時計（秒）
+
+# 感情状態別の認知バイアス調整（EmotionalStateの整数値で直接索引、共有するため読み取り専用）
+_NO_ADJUSTMENTS: Mapping[str, float] = MappingProxyType({})
+_COGNITIVE_ADJUSTMENTS: Tuple[Mapping[str, float], ...] = (
+    _NO_ADJUSTMENTS,  # NEUTRAL
+    _NO_ADJUSTMENTS,  # POSITIVE
+    _NO_ADJUSTMENTS,  # NEGATIVE
+    MappingProxyType({'risk_aversion': 0.3, 'attention_narrowing': 0.2}),  # ANXIOUS: 保守的バイアス
+    MappingProxyType({'risk_tolerance': 0.2, 'attention_broadening': 0.1}),  # CONFIDENT: 積極的バイアス
+    MappingProxyType({'impulsivity': 0.3, 'patience_reduction': 0.2})  # FRUSTRATED: 注意散漫
+)
 
 class FeedbackLoopManager:
     """フィードバックループ管理システム"""
@@ -72,6 +87,10 @@ class FeedbackLoopManager:
     def __init__(self):
         self.active_loops: Dict[str, FeedbackLoop] = {}
         self.loop_history = deque(maxlen=1000)
+        
+        # 次回実行予定（単調時計, loop_id）の最小ヒープと、ループ実行の最短間隔（秒）
+        self._due_heap: List[Tuple[float, str]] = []
+        self.min_dispatch_interval = 1.0
         self.performance_metrics = {
             'total_feedback_cycles': 0,
             'successful_adaptations': 0,
@@ -126,22 +145,41 @@ class FeedbackLoopManager:
         
         for loop in standard_loops:
             self.active_loops[loop.loop_id] = loop
+            heapq.heappush(self._due_heap, (self._next_due(loop, loop.last_update_mono), loop.loop_id))
+    
+    def _next_due(self, loop: FeedbackLoop, now: float) -> float:
+        """次回実行予定時刻（単調時計）"""
+        return now + max(loop.update_interval, self.min_dispatch_interval)
+    
+    async def run_forever(self, system_components: Dict[str, Any]):
+        """実行予定が最も早いループまで待機して実行する（周期的な全ループ走査は行わない）"""
+        due_heap = self._due_heap
+        while True:
+            await self.manage_feedback_loops(system_components)
+            
+            # 先頭の予定時刻まで待機（待機中にキャンセルされても予定は失われない）
+            delay = due_heap[0][0] - time.monotonic() if due_heap else self.min_dispatch_interval
+            if delay > 0:
+                await asyncio.sleep(delay)
     
     async def manage_feedback_loops(self, system_components: Dict[str, Any]):
-        """フィードバックループの管理"""
+        """実行予定時刻を過ぎたフィードバックループの実行（予定は_due_heapで一元管理）"""
         try:
-            current_time = datetime.now()
-            
-            # 各ループの更新チェック
-            for loop_id, loop in self.active_loops.items():
-                if not loop.active:
-                    continue
-                
-                time_since_update = (current_time - loop.last_update).total_seconds()
+            due_heap = self._due_heap
+            now = time.monotonic()
+            
+            while due_heap and due_heap[0][0] <= now:
+                _, loop_id = heapq.heappop(due_heap)
+                loop = self.active_loops.get(loop_id)
+                if loop is None:
+                    continue  # 削除済みのループは再登録しない
                 
-                if time_since_update >= loop.update_interval:
+                # 次回予定は実行前に登録（非アクティブなループも再開に備えて予定だけ残す）
+                heapq.heappush(due_heap, (self._next_due(loop, now), loop_id))
+                if loop.active:
                     await self._execute_feedback_loop(loop, system_components)
-                    loop.last_update = current_time
+                    loop.last_update_mono = now
+                    loop.last_update = datetime.now()
                     self.performance_metrics['total_feedback_cycles'] += 1
             
         except Exception as e:
@@ -217,33 +255,18 @@ class FeedbackLoopManager:
             return
         
         try:
-            # 感情状態の取得
-            emotional_stats = emotional_system.get_emotional_statistics()
-            current_state = emotional_stats.get('current_state', 'neutral')
+            # 感情状態の取得（統計全体は構築せず現在の状態のみ参照）
+            current_state = emotional_system.current_emotional_state
             
-            # 認知バイアス調整
-            cognitive_adjustments = {}
-            
-            if current_state == 'anxious':
-                # 不安時は保守的バイアス
-                cognitive_adjustments['risk_aversion'] = 0.3
-                cognitive_adjustments['attention_narrowing'] = 0.2
-                
-            elif current_state == 'confident':
-                # 自信時は積極的バイアス
-                cognitive_adjustments['risk_tolerance'] = 0.2
-                cognitive_adjustments['attention_broadening'] = 0.1
-                
-            elif current_state == 'frustrated':
-                # フラストレーション時は注意散漫
-                cognitive_adjustments['impulsivity'] = 0.3
-                cognitive_adjustments['patience_reduction'] = 0.2
+            # 認知バイアス調整（感情状態別の表を参照）
+            cognitive_adjustments = _COGNITIVE_ADJUSTMENTS[current_state]
             
             # 実行制御システムへの調整適用
             if hasattr(executive_controller, 'apply_emotional_bias'):
                 await executive_controller.apply_emotional_bias(cognitive_adjustments)
             
-            logging.debug(f"🔄 感情→実行フィードバック: {current_state} -> {len(cognitive_adjustments)}調整")
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("🔄 感情→実行フィードバック: %s -> %d調整", current_state.label, len(cognitive_adjustments))
             
         except Exception as e:
             logging.error(f"❌ 感情→実行フィードバックエラー: {e}")
@@ -337,6 +360,22 @@ class FeedbackLoopManager:
             }
         }
 
+# 実行成功率の処理モード別・脅威レベル別の調整量
+_MODE_SUCCESS_ADJUSTMENTS: Dict[ProcessingMode, float] = {
+    ProcessingMode.EMERGENCY: 0.3,    # 緊急モードでは安全処理により成功率向上
+    ProcessingMode.ANALYTICAL: 0.2,
+    ProcessingMode.INTUITIVE: 0.1,
+    ProcessingMode.MAINTENANCE: 0.2
+}
+# 適切な処理により脅威を回避する前提で、高脅威は固定値・それ以外は (6 - level) * 0.1
+_THREAT_SUCCESS_ADJUSTMENTS: Dict[ThreatLevel, float] = {
+    ThreatLevel.SAFE: 0.5,                    # (6 - 1) * 0.1
+    ThreatLevel.LOW: 0.4,                     # (6 - 2) * 0.1
+    ThreatLevel.MODERATE: 0.3,                # (6 - 3) * 0.1
+    ThreatLevel.HIGH: 0.15,
+    ThreatLevel.CRITICAL: 0.1
+}
+
 class IntegratedNeuralSystem:
     """統合神経システム - 脳型統合処理"""
     
@@ -364,6 +403,10 @@ class IntegratedNeuralSystem:
         # 緊急時閾値
         self.EMERGENCY_THRESHOLD = ThreatLevel.HIGH
         
+        # 目標ごとの学習フィードバック（結果を返した後にバックグラウンドで実行、完了まで参照を保持）
+        self._learning_tasks: Set[asyncio.Task] = set()
+        self._feedback_task: Optional[asyncio.Task] = None
+        
     async def initialize_neural_systems(self, neural_kernel, emotional_system, executive_controller):
         """神経系コンポーネントの初期化"""
         try:
@@ -379,7 +422,7 @@ class IntegratedNeuralSystem:
             }
             
             # バックグラウンドでフィードバックループを実行
-            asyncio.create_task(self._continuous_feedback_management(system_components))
+            self._feedback_task = asyncio.create_task(self._continuous_feedback_management(system_components))
             
             logging.info("🧠 統合神経システム初期化完了")
             return True
@@ -398,11 +441,15 @@ class IntegratedNeuralSystem:
             
             logging.info(f"🧠 神経統合処理開始: {user_goal[:50]}...")
             
-            # 1. 基盤システム状態確認（脳幹レベル）
-            system_state = await self._check_neural_foundation(user_goal)
+            # 直前の目標の学習結果（感情記憶・統合レベル等）を反映してから評価する
+            await self.wait_for_pending_learning()
             
-            # 2. 感情的・記憶的評価（大脳辺縁系レベル）
-            emotional_context = await self._evaluate_emotional_limbic(user_goal, context)
+            # 1-2. 基盤システム状態確認（脳幹レベル）と感情的・記憶的評価（大脳辺縁系レベル）
+            # 互いに独立したサブシステムのため並行して実行
+            system_state, emotional_context = await asyncio.gather(
+                self._check_neural_foundation(user_goal),
+                self._evaluate_emotional_limbic(user_goal, context)
+            )
             
             # 3. 処理モード決定
             processing_mode = self._determine_processing_mode(system_state, emotional_context)
@@ -420,10 +467,16 @@ class IntegratedNeuralSystem:
                 executive_decision, emotional_context, processing_mode
             )
             
-            # 7. 学習フィードバック
-            learning_updates = await self._neural_learning_integration(
+            # 7. 学習フィードバック（完了を待たずに結果を返し、次の処理開始時に合流）
+            # 結果には予約時点の状態（'scheduled'）を載せ、学習結果はwait_for_pending_learning()で受け取る
+            learning_updates, learning_steps = self._prepare_learning_steps(
                 user_goal, executive_decision, execution_result, emotional_context
             )
+            learning_task = asyncio.create_task(
+                self._neural_learning_integration(user_goal, learning_steps)
+            )
+            self._learning_tasks.add(learning_task)
+            learning_task.add_done_callback(self._learning_tasks.discard)
             
             # 8. 結果の統合
             processing_result = self._create_processing_result(
@@ -660,24 +713,9 @@ class IntegratedNeuralSystem:
             # 統合レベルによるボーナス
             integration_bonus = self.current_integration_level.value * 0.15
             
-            # 処理モードによる調整
-            if processing_mode == ProcessingMode.EMERGENCY:
-                # 緊急モードでは安全処理により成功率向上
-                mode_adjustment = 0.3
-            elif processing_mode == ProcessingMode.ANALYTICAL:
-                mode_adjustment = 0.2
-            elif processing_mode == ProcessingMode.INTUITIVE:
-                mode_adjustment = 0.1
-            else:  # MAINTENANCE
-                mode_adjustment = 0.2
-            
-            # 脅威レベルによる調整（適切な処理により脅威を回避）
-            if emotional_context.threat_level == ThreatLevel.CRITICAL:
-                threat_adjustment = 0.1  # 危険だが適切な処理で対応
-            elif emotional_context.threat_level == ThreatLevel.HIGH:
-                threat_adjustment = 0.15
-            else:
-                threat_adjustment = (6 - emotional_context.threat_level.value) * 0.1
+            # 処理モード・脅威レベルによる調整
+            mode_adjustment = _MODE_SUCCESS_ADJUSTMENTS[processing_mode]
+            threat_adjustment = _THREAT_SUCCESS_ADJUSTMENTS[emotional_context.threat_level]
             
             success_probability = base_success + integration_bonus + mode_adjustment + threat_adjustment
             success_probability = min(max(success_probability, 0.1), 0.95)  # 10%-95%の範囲
@@ -704,43 +742,81 @@ class IntegratedNeuralSystem:
                 'error': str(e)
             }
     
-    async def _neural_learning_integration(self, user_goal: str, executive_decision: ExecutiveDecision,
-                                         execution_result: Dict[str, Any], 
-                                         emotional_context: EmotionalContext) -> Dict[str, Any]:
-        """神経学習統合"""
+    async def wait_for_pending_learning(self) -> List[Dict[str, Any]]:
+        """呼び出し時点でバックグラウンド実行中の学習フィードバックの完了を待ち、各目標の学習結果を返す"""
+        if not self._learning_tasks:
+            return []
+        results = await asyncio.gather(*self._learning_tasks, return_exceptions=True)
+        return [result for result in results if isinstance(result, dict)]
+    
+    async def shutdown(self):
+        """統合神経システムの停止（学習フィードバックを全て完了させてからフィードバックループを止める）"""
+        while self._learning_tasks:
+            await self.wait_for_pending_learning()
+        
+        feedback_task = self._feedback_task
+        if feedback_task is not None:
+            self._feedback_task = None
+            feedback_task.cancel()
+            await asyncio.gather(feedback_task, return_exceptions=True)
+        
+        logging.info("🧠 統合神経システム停止完了")
+    
+    async def _neural_learning_integration(self, user_goal: str,
+                                         learning_steps: Dict[str, Awaitable]) -> Dict[str, Any]:
+        """神経学習統合（学習処理を並行実行し、処理ごとの成否を返す）"""
+        learning_outcomes: Dict[str, Any] = {'goal': user_goal}
+        results = await asyncio.gather(*learning_steps.values(), return_exceptions=True)
+        for learning_key, result in zip(learning_steps, results):
+            if isinstance(result, Exception):
+                logging.error(f"❌ 神経学習統合エラー ({learning_key}): {user_goal[:50]} - {result}")
+                learning_outcomes[learning_key] = False
+                learning_outcomes['learning_error'] = str(result)
+            else:
+                learning_outcomes[learning_key] = True
+        return learning_outcomes
+    
+    def _prepare_learning_steps(self, user_goal: str, executive_decision: ExecutiveDecision,
+                                execution_result: Dict[str, Any],
+                                emotional_context: EmotionalContext) -> Tuple[Dict[str, Any], Dict[str, Awaitable]]:
+        """学習フィードバックの準備（更新内容と、互いに独立して並行実行できる学習処理）
+        
+        更新内容は予約時点の状態（'scheduled'）で、学習の成否は_neural_learning_integrationが返す
+        """
+        learning_steps = {}
         try:
-            learning_updates = {}
-            
             # 感情システムへの学習フィードバック
             if self.emotional_system:
-                await self.emotional_system.process_task_outcome(
+                learning_steps['emotional_learning'] = self.emotional_system.process_task_outcome(
                     executive_decision.decision_id,
                     user_goal,
                     "general",
                     execution_result,
                     emotional_context
                 )
-                learning_updates['emotional_learning'] = True
             
             # 実行制御システムへの学習フィードバック
             if self.executive_controller:
-                await self.executive_controller.update_strategy_performance(
+                learning_steps['executive_learning'] = self.executive_controller.update_strategy_performance(
                     executive_decision.decision_id,
                     execution_result.get('success', False),
                     execution_result.get('performance_metrics', {})
                 )
-                learning_updates['executive_learning'] = True
             
             # 神経接続最適化
             success_metric = execution_result.get('quality', 0.5 if execution_result.get('success') else 0.1)
-            await self.optimize_neural_connections(user_goal, executive_decision, execution_result, success_metric)
-            learning_updates['neural_optimization'] = True
-            
-            return learning_updates
+            learning_steps['neural_optimization'] = self.optimize_neural_connections(
+                user_goal, executive_decision, execution_result, success_metric
+            )
             
         except Exception as e:
             logging.error(f"❌ 神経学習統合エラー: {e}")
-            return {'learning_error': str(e)}
+            # 生成済みの学習処理は実行せずに破棄
+            for learning_step in learning_steps.values():
+                learning_step.close()
+            return {'learning_error': str(e)}, {}
+        
+        return dict.fromkeys(learning_steps, 'scheduled'), learning_steps
     
     def _create_processing_result(self, user_goal: str, processing_mode: ProcessingMode,
                                 executive_decision: ExecutiveDecision, emotional_context: EmotionalContext,
@@ -797,9 +873,7 @@ class IntegratedNeuralSystem:
     async def _continuous_feedback_management(self, system_components: Dict[str, Any]):
         """継続的フィードバック管理"""
         try:
-            while True:
-                await self.feedback_manager.manage_feedback_loops(system_components)
-                await asyncio.sleep(1.0)  # 1秒間隔
+            await self.feedback_manager.run_forever(system_components)
                 
         except asyncio.CancelledError:
             logging.debug("🔄 フィードバック管理停止")
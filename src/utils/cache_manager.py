@@ -3,12 +3,13 @@
 LLMレスポンスを効率的にキャッシュし、API使用量を削減
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import pickle
 import time
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 from datetime import datetime, timedelta
 from collections import OrderedDict
 import os
@@ -282,4 +283,47 @@ class BatchCache:
             'cached_responses': cached_count,
             'cache_hit_rate': (cached_count / total_count * 100) if total_count > 0 else 0,
             'remaining_requests': total_count - cached_count
-        }
\ No newline at end of file
+        }
+
+class SingleFlight:
+    """同一キーの同時リクエストを1回の実行にまとめる"""
+    
+    def __init__(self):
+        self.inflight: Dict[str, asyncio.Task] = {}
+        self._waiter_counts: Dict[asyncio.Task, int] = {}
+        self.stats = {
+            'executions': 0,
+            'coalesced': 0
+        }
+    
+    async def run(self, key: str, request_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """実行中の同一リクエストがあればその結果を待ち、なければ実行
+        
+        リクエストはSingleFlightが所有するタスクで実行するため、最初の呼び出し元が
+        キャンセルされても他の待機者には影響しない（待機者が全員いなくなった時のみ取り消す）
+        """
+        task = self.inflight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+            logging.debug(f"🔗 同時リクエストを集約: {key[:32]}...")
+        else:
+            task = asyncio.create_task(request_factory())
+            self.inflight[key] = task
+            self._waiter_counts[task] = 0
+            self.stats['executions'] += 1
+            task.add_done_callback(lambda done_task: self._release(key, done_task))
+        
+        self._waiter_counts[task] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if not task.done():
+                self._waiter_counts[task] -= 1
+                if self._waiter_counts[task] == 0:
+                    task.cancel()
+    
+    def _release(self, key: str, task: asyncio.Task):
+        """完了したリクエストの登録解除"""
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        self._waiter_counts.pop(task, None)
@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.core.emotional_system import (
     EmotionalProcessingSystem, ThreatDetector, AdaptiveMemory, RewardSystem,
-    ThreatLevel, EmotionalState
+    EmotionalSystemRegistry, ThreatLevel, EmotionalState
 )
 
 async def test_threat_detector():
@@ -37,13 +37,13 @@ async def test_threat_detector():
     
     print("\n1. 脅威レベル評価テスト")
     for description, task_type in test_cases:
-        threat_level, threat_score, details = await detector.assess_threat(description, task_type)
+        threat_level, threat_score, details = detector.assess_threat(description, task_type)
         print(f"✅ '{description[:30]}...' -> {threat_level.name} (スコア: {threat_score:.2f})")
     
     print("\n2. 学習機能テスト")
     # 失敗体験から学習
-    await detector.learn_from_outcome("dangerous operation", False, 0.8)
-    await detector.learn_from_outcome("safe task execution", True, 0.0)
+    detector.learn_from_outcome("dangerous operation", False, 0.8)
+    detector.learn_from_outcome("safe task execution", True, 0.0)
     
     print("✅ 脅威パターン学習完了")
     print(f"✅ 学習済みパターン数: {len(detector.learned_threats)}")
@@ -82,21 +82,21 @@ async def test_adaptive_memory():
     ]
     
     for task_id, description, task_type, quality, success, exec_time in experiences:
-        await memory.store_experience(
+        memory.store_experience(
             task_id, description, task_type, quality, success, exec_time, emotional_context
         )
     
     print(f"✅ {len(experiences)}件の経験を保存")
     
     print("\n2. 類似経験想起テスト")
-    similar_experiences = await memory.recall_similar_experiences("Create automation script", "code", limit=3)
+    similar_experiences = memory.recall_similar_experiences("Create automation script", "code", limit=3)
     print(f"✅ 類似経験: {len(similar_experiences)}件発見")
     
     for i, exp in enumerate(similar_experiences):
         print(f"  {i+1}. {exp.task_pattern} -> 成功: {exp.success}, 品質: {exp.result_quality:.2f}")
     
     print("\n3. パターン知識取得テスト")
-    pattern_knowledge = await memory.get_pattern_knowledge("create_script", "code")
+    pattern_knowledge = memory.get_pattern_knowledge("create_script", "code")
     print(f"✅ パターン知識取得: {len(pattern_knowledge)}項目")
     
     print("\n4. 記憶統計テスト")
@@ -138,12 +138,12 @@ async def test_reward_system():
     ]
     
     for i, result in enumerate(test_results):
-        reward = await reward_system.calculate_reward(result, confident_context)
+        reward = reward_system.calculate_reward(result, confident_context)
         print(f"✅ テスト{i+1}: 成功={result['success']}, 報酬={reward:.2f}")
     
     print("\n2. 期待値学習テスト")
-    await reward_system.update_expectations("test_pattern", 0.8)
-    await reward_system.update_expectations("test_pattern", 0.6)
+    reward_system.update_expectations("test_pattern", 0.8)
+    reward_system.update_expectations("test_pattern", 0.6)
     
     print("✅ 期待値学習完了")
     
@@ -175,7 +175,7 @@ async def test_emotional_processing_system():
         context = await emotional_system.evaluate_task_emotion(task, task_type)
         emotional_contexts.append((task, context))
         
-        print(f"✅ '{task[:30]}...' -> {context.state.value} "
+        print(f"✅ '{task[:30]}...' -> {context.state.label} "
               f"(脅威: {context.threat_level.name}, 信頼度: {context.confidence:.2f})")
     
     print("\n2. 結果処理テスト")
@@ -207,10 +207,26 @@ async def test_emotional_processing_system():
     print("\n4. 統計情報テスト")
     stats = emotional_system.get_emotional_statistics()
     
-    print(f"✅ 現在の感情状態: {stats['current_state']}")
-    print(f"✅ 学習済み脅威: {stats['threat_detector']['learned_threats']}個")
-    print(f"✅ 総経験数: {stats['memory_manager']['total_experiences']}件")
-    print(f"✅ 報酬履歴: {stats['reward_system']['reward_history_size']}件")
+    print(f"✅ 現在の感情状態: {stats.current_state}")
+    print(f"✅ 学習済み脅威: {stats.learned_threats}個")
+    print(f"✅ 総経験数: {stats.memory_manager['total_experiences']}件")
+    print(f"✅ 報酬履歴: {stats.reward_history_size}件")
+    
+    print("\n5. レジストリ集計テスト")
+    registry = EmotionalSystemRegistry(initial_capacity=1)
+    agents = [EmotionalProcessingSystem(registry=registry) for _ in range(3)]
+    for agent in agents:
+        context = await agent.evaluate_task_emotion("Write unit tests", "code")
+        await agent.process_task_outcome(
+            "registry_task", "Write unit tests", "code",
+            {'success': True, 'execution_time': 5.0, 'quality': 0.9}, context
+        )
+    aggregate = registry.get_aggregate_statistics()
+    assert aggregate['systems'] == 3
+    assert aggregate['emotional_history_size'] == 3
+    assert aggregate['total_experiences'] == 3
+    assert aggregate['reward_history_size'] == 3
+    print(f"✅ 集計: {aggregate}")
     
     print("✅ 感情処理システム統合テスト完了\n")
 
@@ -229,7 +245,7 @@ async def test_learning_adaptation():
     print(f"反復タスク: {repeated_task}")
     
     initial_context = await emotional_system.evaluate_task_emotion(repeated_task, "code")
-    print(f"✅ 初回評価: 信頼度={initial_context.confidence:.2f}, 状態={initial_context.state.value}")
+    print(f"✅ 初回評価: 信頼度={initial_context.confidence:.2f}, 状態={initial_context.state.label}")
     
     # 成功体験を複数回蓄積
     for i in range(5):
@@ -246,7 +262,7 @@ async def test_learning_adaptation():
     
     # 学習後の評価
     learned_context = await emotional_system.evaluate_task_emotion(repeated_task, "code")
-    print(f"✅ 学習後評価: 信頼度={learned_context.confidence:.2f}, 状態={learned_context.state.value}")
+    print(f"✅ 学習後評価: 信頼度={learned_context.confidence:.2f}, 状態={learned_context.state.label}")
     
     confidence_improvement = learned_context.confidence - initial_context.confidence
     print(f"✅ 信頼度向上: {confidence_improvement:+.2f}")
@@ -264,7 +280,7 @@ async def test_learning_adaptation():
     states_sequence = []
     for task, task_type in emotional_tasks:
         context = await emotional_system.evaluate_task_emotion(task, task_type)
-        states_sequence.append(context.state.value)
+        states_sequence.append(context.state.label)
         await asyncio.sleep(0.1)  # 短時間待機
     
     print(f"✅ 感情状態変化: {' -> '.join(states_sequence)}")
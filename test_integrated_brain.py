@@ -55,6 +55,7 @@ async def test_integrated_system_initialization():
         print(f"✅ フィードバックループ: {stats['feedback_statistics']['active_loops']}個アクティブ")
         
         # クリーンアップ
+        await integrated_system.shutdown()
         await neural_kernel.stop_neural_kernel()
         print("✅ システム停止完了")
         
@@ -102,7 +103,7 @@ async def test_brain_goal_processing():
             
             print(f"   処理モード: {result.processing_mode.value}")
             print(f"   統合レベル: {result.integration_level.name}")
-            print(f"   感情状態: {result.emotional_context.state.value}")
+            print(f"   感情状態: {result.emotional_context.state.label}")
             print(f"   脅威レベル: {result.emotional_context.threat_level.name}")
             print(f"   実行時間: {execution_time:.2f}秒")
             print(f"   成功: {'✅' if result.success else '❌'}")
@@ -129,6 +130,7 @@ async def test_brain_goal_processing():
         print(f"  脅威レベル分布: {set(threat_levels)}")
         
         # クリーンアップ
+        await integrated_system.shutdown()
         await neural_kernel.stop_neural_kernel()
         
         return success_count / len(results) > 0.6  # 60%以上の成功率
@@ -180,6 +182,7 @@ async def test_feedback_loops():
         
         # 最終統計確認
         print("\n4. フィードバック後統計確認")
+        await integrated_system.wait_for_pending_learning()
         final_stats = integrated_system.get_integration_statistics()
         
         learning_metrics = final_stats['learning_metrics']
@@ -195,6 +198,7 @@ async def test_feedback_loops():
             print("⚠️ 適応イベントは発生せず（正常な場合もあり）")
         
         # クリーンアップ
+        await integrated_system.shutdown()
         await neural_kernel.stop_neural_kernel()
         
         return True
@@ -249,7 +253,7 @@ async def test_emotional_cognitive_integration():
             result = await integrated_system.process_goal_neural(goal)
             
             # 感情・認知統合の確認
-            emotional_state = result.emotional_context.state.value
+            emotional_state = result.emotional_context.state.label
             threat_level = result.emotional_context.threat_level.name
             processing_mode = result.processing_mode.value
             
@@ -294,6 +298,7 @@ async def test_emotional_cognitive_integration():
             print("❌ 感情・認知統合に問題あり")
         
         # クリーンアップ
+        await integrated_system.shutdown()
         await neural_kernel.stop_neural_kernel()
         
         return avg_integration_quality > 0.5
@@ -339,8 +344,9 @@ async def test_learning_adaptation():
                 learning_metrics = current_stats['learning_metrics']
                 print(f"   回数 {i+1}: 成功率 {learning_metrics['successful_integrations']}/{learning_metrics['total_goals_processed']}")
         
-        # 学習効果の分析
+        # 学習効果の分析（最後の目標の学習フィードバック完了を待つ）
         print(f"\n3. 学習効果分析:")
+        await integrated_system.wait_for_pending_learning()
         final_stats = integrated_system.get_integration_statistics()
         final_learning = final_stats['learning_metrics']
         
@@ -378,6 +384,7 @@ async def test_learning_adaptation():
             print(f"⚠️ 統合レベル変化なし")
         
         # クリーンアップ
+        await integrated_system.shutdown()
         await neural_kernel.stop_neural_kernel()
         
         return adaptation_events > 0 or improvement > 0